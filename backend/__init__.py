@@ -0,0 +1,6 @@
+"""
+Task Management System backend
+
+Models, Supabase sync and environment helpers. Scripts at the project root
+import these as `backend.<module>`.
+"""
@@ -0,0 +1,28 @@
+"""
+Environment loading for the backend
+
+Supabase credentials are read once per process. If SUPABASE_URL and
+SUPABASE_KEY are already set in the environment (e.g. on a server),
+backend/.env is not parsed at all.
+"""
+
+import os
+from functools import cache
+from pathlib import Path
+from typing import Optional, Tuple
+
+ENV_FILE = Path(__file__).parent / '.env'
+
+
+@cache
+def _env() -> Tuple[Optional[str], Optional[str]]:
+    """Return (SUPABASE_URL, SUPABASE_KEY), loading backend/.env on first call if needed"""
+    if not (os.environ.get('SUPABASE_URL') and os.environ.get('SUPABASE_KEY')):
+        # Imported only when the file actually has to be parsed
+        try:
+            from dotenv import load_dotenv
+        except ImportError:
+            print("python-dotenv not installed; reading credentials from the environment only")
+        else:
+            load_dotenv(ENV_FILE)
+    return os.environ.get('SUPABASE_URL'), os.environ.get('SUPABASE_KEY')
@@ -0,0 +1,39 @@
+"""
+Shared HTTP settings for the Supabase clients
+
+Both sync layers hand supabase-py their own pooled httpx client, so every
+request made through one TaskSync/ImprovedTaskSync instance reuses the same
+keep-alive connections instead of paying a TCP/TLS handshake each time.
+"""
+
+from typing import Any, Dict
+
+# Idle pooled connections are kept this long (seconds) before being closed
+KEEPALIVE_EXPIRY = 60.0
+
+
+def _httpx_settings() -> Dict[str, Any]:
+    """
+    Settings for the pooled httpx clients handed to supabase-py
+
+    Connections are kept alive between requests, and HTTP/2 (when the h2
+    package is installed) lets concurrent requests share one TLS connection
+    instead of opening a new one each.
+    """
+    import httpx
+
+    try:
+        import h2  # noqa: F401
+        http2 = True
+    except ImportError:
+        http2 = False
+
+    return {
+        'http2': http2,
+        'timeout': 10,
+        'limits': httpx.Limits(
+            max_keepalive_connections=20,
+            max_connections=50,
+            keepalive_expiry=KEEPALIVE_EXPIRY,
+        ),
+    }
@@ -0,0 +1,75 @@
+"""
+Retry helper for Supabase calls
+
+Transient failures (connection errors, timeouts, HTTP 429 and 5xx) are
+retried with exponential backoff and full jitter, honouring Retry-After when
+the server sends one. Only wrap idempotent operations: selects, and upserts
+keyed on the natural `date` column.
+"""
+
+import asyncio
+import random
+import time
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+T = TypeVar('T')
+
+RETRY_ATTEMPTS = 3
+RETRY_INITIAL_DELAY = 0.1
+RETRY_MAX_DELAY = 2.0
+
+
+def _status_code(exc: BaseException) -> Optional[int]:
+    """HTTP status of a failed request, from httpx or postgrest errors"""
+    response = getattr(exc, 'response', None)
+    if response is not None:
+        return response.status_code
+    # postgrest's APIError carries the status as `code` when the body wasn't JSON.
+    # Otherwise `code` is a SQLSTATE (e.g. 23505) or PGRSTxxx, which is not a status
+    code = str(getattr(exc, 'code', None))
+    if len(code) == 3 and code.isdigit() and 100 <= int(code) <= 599:
+        return int(code)
+    return None
+
+
+def is_transient(exc: BaseException) -> bool:
+    """True for errors worth retrying: network failures, 429 and 5xx"""
+    # Only reached on failure, so httpx (already loaded by the client) is imported here
+    import httpx
+
+    if isinstance(exc, httpx.TransportError):
+        return True
+    status = _status_code(exc)
+    return status is not None and (status == 429 or status >= 500)
+
+
+def _delay(exc: BaseException, attempt: int) -> float:
+    """Seconds to wait before the next attempt"""
+    response = getattr(exc, 'response', None)
+    if response is not None:
+        retry_after = response.headers.get('Retry-After')
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), RETRY_MAX_DELAY * 4)
+    return random.uniform(0, min(RETRY_MAX_DELAY, RETRY_INITIAL_DELAY * 2 ** attempt))
+
+
+def with_retry(call: Callable[[], T], attempts: int = RETRY_ATTEMPTS) -> T:
+    """Run `call`, retrying transient failures; the last error is re-raised"""
+    for attempt in range(attempts):
+        try:
+            return call()
+        except Exception as e:
+            if attempt == attempts - 1 or not is_transient(e):
+                raise
+            time.sleep(_delay(e, attempt))
+
+
+async def awith_retry(call: Callable[[], Awaitable[Any]], attempts: int = RETRY_ATTEMPTS) -> Any:
+    """Async variant of with_retry for the async Supabase client"""
+    for attempt in range(attempts):
+        try:
+            return await call()
+        except Exception as e:
+            if attempt == attempts - 1 or not is_transient(e):
+                raise
+            await asyncio.sleep(_delay(e, attempt))
@@ -5,10 +5,11 @@ Pydantic models for type safety and validation of task data.
 These models match the JSON structure stored in Supabase.
 """
 
-from pydantic import BaseModel, Field, validator
-from typing import List, Optional, Dict, Any
+from pydantic import BaseModel, Field, PrivateAttr, model_serializer, validator
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, date
 from enum import Enum
+from collections import Counter
 import uuid
 
 
@@ -48,7 +49,7 @@ class Category(str, Enum):
 
 class Subtask(BaseModel):
     """Individual subtask within a larger task"""
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     title: str = Field(..., min_length=1, max_length=200)
     completed: bool = False
     notes: Optional[str] = None
@@ -56,7 +57,7 @@ class Subtask(BaseModel):
 
 class Task(BaseModel):
     """Main task object with all metadata"""
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     title: str = Field(..., min_length=1, max_length=200)
     description: str = Field(default="", max_length=1000)
     priority: Priority = Priority.P2
@@ -87,9 +88,9 @@ class Task(BaseModel):
     def validate_progress(cls, v, values):
         """Ensure progress aligns with status"""
         status = values.get('status')
-        if status == TaskStatus.COMPLETED and v != 100:
+        if status is TaskStatus.COMPLETED and v != 100:
             return 100
-        elif status == TaskStatus.NOT_STARTED and v > 0:
+        elif status is TaskStatus.NOT_STARTED and v > 0:
             return 0
         return v
 
@@ -97,24 +98,27 @@ class Task(BaseModel):
     def set_completed_at(cls, v, values):
         """Auto-set completion time when status is completed"""
         status = values.get('status')
-        if status == TaskStatus.COMPLETED and not v:
+        if status is TaskStatus.COMPLETED and not v:
             return datetime.now().isoformat()
-        elif status != TaskStatus.COMPLETED:
+        elif status is not TaskStatus.COMPLETED:
             return None
         return v
 
     def add_note(self, note: str) -> None:
         """Add a timestamped note to the task"""
-        timestamp = datetime.now().strftime("%H:%M")
+        now = datetime.now()
+        timestamp = f"{now.hour:02d}:{now.minute:02d}"
         self.notes.append(f"[{timestamp}] {note}")
-        self.updated_at = datetime.now().isoformat()
+        self.updated_at = now.isoformat()
 
-    def mark_completed(self) -> None:
+    def mark_completed(self, now_iso: Optional[str] = None) -> None:
         """Mark task as completed with timestamp"""
+        if now_iso is None:
+            now_iso = datetime.now().isoformat()
         self.status = TaskStatus.COMPLETED
         self.progress = 100
-        self.completed_at = datetime.now().isoformat()
-        self.updated_at = datetime.now().isoformat()
+        self.completed_at = now_iso
+        self.updated_at = now_iso
 
     def add_subtask(self, title: str) -> str:
         """Add a new subtask and return its ID"""
@@ -128,12 +132,13 @@ class Task(BaseModel):
         for subtask in self.subtasks:
             if subtask.id == subtask_id:
                 subtask.completed = True
-                self.updated_at = datetime.now().isoformat()
-                self._update_progress_from_subtasks()
+                now_iso = datetime.now().isoformat()
+                self.updated_at = now_iso
+                self._update_progress_from_subtasks(now_iso)
                 return True
         return False
 
-    def _update_progress_from_subtasks(self) -> None:
+    def _update_progress_from_subtasks(self, now_iso: Optional[str] = None) -> None:
         """Auto-calculate progress based on completed subtasks"""
         if not self.subtasks:
             return
@@ -143,8 +148,8 @@ class Task(BaseModel):
         self.progress = int((completed / total) * 100)
 
         # Auto-complete task if all subtasks done
-        if completed == total and self.status != TaskStatus.COMPLETED:
-            self.mark_completed()
+        if completed == total and self.status is not TaskStatus.COMPLETED:
+            self.mark_completed(now_iso)
 
 
 class DaySummary(BaseModel):
@@ -165,40 +170,42 @@ class DaySummary(BaseModel):
         if not tasks:
             return cls()
 
-        # Count by status
-        completed = len([t for t in tasks if t.status == TaskStatus.COMPLETED])
-        in_progress = len([t for t in tasks if t.status == TaskStatus.IN_PROGRESS])
-        blocked = len([t for t in tasks if t.status == TaskStatus.BLOCKED])
-
-        # Time totals
-        estimated = sum(t.estimated_minutes for t in tasks)
-        actual = sum(t.actual_minutes for t in tasks)
-
-        # Completion percentage
-        completion = (completed / len(tasks)) * 100 if tasks else 0
+        # Single pass over the tasks: status counts, time totals and breakdowns
+        completed = in_progress = blocked = 0
+        estimated = actual = 0
+        categories = Counter()
+        priorities = Counter()
 
-        # Category breakdown
-        categories = {}
         for task in tasks:
-            cat = task.category.value
-            categories[cat] = categories.get(cat, 0) + 1
-
-        # Priority breakdown
-        priorities = {}
-        for task in tasks:
-            pri = task.priority.value
-            priorities[pri] = priorities.get(pri, 0) + 1
-
-        return cls(
-            total_tasks=len(tasks),
+            status = task.status
+            if status is TaskStatus.COMPLETED:
+                completed += 1
+            elif status is TaskStatus.IN_PROGRESS:
+                in_progress += 1
+            elif status is TaskStatus.BLOCKED:
+                blocked += 1
+
+            estimated += task.estimated_minutes
+            actual += task.actual_minutes
+            # Count by enum member; .value is resolved once per key below
+            categories[task.category] += 1
+            priorities[task.priority] += 1
+
+        # Completion percentage to one decimal, rounded half-up in integer math
+        total = len(tasks)
+        completion = (completed * 2000 + total) // (2 * total) / 10.0
+
+        # Every value is computed here from validated tasks, so skip validation
+        return cls.model_construct(
+            total_tasks=total,
             completed_tasks=completed,
             in_progress_tasks=in_progress,
             blocked_tasks=blocked,
             total_estimated_minutes=estimated,
             total_actual_minutes=actual,
-            completion_percentage=round(completion, 1),
-            categories=categories,
-            priorities=priorities
+            completion_percentage=completion,
+            categories={k.value: v for k, v in categories.items()},
+            priorities={k.value: v for k, v in priorities.items()}
         )
 
 
@@ -206,7 +213,9 @@ class DailyTasks(BaseModel):
     """Complete daily task data for storage in Supabase"""
     date: str = Field(default_factory=lambda: date.today().isoformat())
     tasks: List[Task] = Field(default_factory=list)
-    summary: DaySummary = Field(default_factory=DaySummary)
+    # Populated from / serialized as "summary"; read it through the `summary`
+    # property, which recomputes it first if tasks were added or removed
+    stored_summary: DaySummary = Field(default_factory=DaySummary, alias='summary')
 
     @validator('date')
     def validate_date_format(cls, v):
@@ -217,47 +226,184 @@ class DailyTasks(BaseModel):
         except ValueError:
             raise ValueError("Date must be in YYYY-MM-DD format")
 
+    # Lazily built ID -> position in `tasks`. `tasks` is a public list, so every
+    # hit is checked against it and a mismatch or miss rebuilds the index
+    _positions: Optional[Dict[str, int]] = PrivateAttr(default=None)
+
+    # Lazily built field -> {value: [tasks]} groupings for the get_tasks_by_*
+    # helpers; dropped on any mutation through this class or assignment of
+    # `tasks`. Editing the list in place needs invalidate_indexes()
+    _groups: Dict[str, Dict[Any, List[Task]]] = PrivateAttr(default_factory=dict)
+
+    # Set when tasks were added/removed since the summary was last computed;
+    # reading or serializing the summary recomputes it only when it is set
+    _summary_dirty: bool = PrivateAttr(default=False)
+
+    def model_post_init(self, __context: Any) -> None:
+        # A summary that was not supplied has to be derived from the tasks
+        self._summary_dirty = bool(self.tasks) and 'stored_summary' not in self.model_fields_set
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name == 'tasks':
+            # A new list: positions, groupings and summary all describe the old one
+            self._positions = None
+            self._groups.clear()
+            self._summary_dirty = True
+
+    @staticmethod
+    def _summary_filter(spec: Any) -> Tuple[bool, Any]:
+        """Whether an include/exclude spec names `summary`, and its nested spec if any"""
+        if not spec or 'summary' not in spec:
+            return False, None
+        nested = spec['summary'] if isinstance(spec, dict) else None
+        return True, (None if nested is True or nested is Ellipsis else nested)
+
+    @model_serializer(mode='wrap')
+    def _serialize(self, handler, info):
+        # Dumps always carry an up-to-date summary, under its public name
+        self.refresh_summary()
+        data = handler(self)
+        # Absent when filtered out by include/exclude; already "summary" when by_alias
+        if 'stored_summary' in data:
+            data['summary'] = data.pop('stored_summary')
+
+        # include/exclude only know the field name, so apply what they say
+        # about "summary" here
+        included, include = self._summary_filter(info.include)
+        excluded, exclude = self._summary_filter(info.exclude)
+        if excluded and exclude is None:
+            data.pop('summary', None)
+        elif included or excluded:
+            if info.exclude_unset and 'stored_summary' not in self.model_fields_set:
+                return data
+            data['summary'] = self.stored_summary.model_dump(
+                mode=info.mode, include=include, exclude=exclude, by_alias=info.by_alias,
+                exclude_defaults=info.exclude_defaults, exclude_none=info.exclude_none
+            )
+        return data
+
+    @property
+    def summary(self) -> DaySummary:
+        """Summary of the day's tasks, recomputed first if tasks were added or removed"""
+        return self.refresh_summary()
+
+    @summary.setter
+    def summary(self, value: DaySummary) -> None:
+        self.stored_summary = value
+        self._summary_dirty = False
+
+    def _find(self, task_id: str) -> Optional[int]:
+        """Position of the first task with `task_id` in `tasks`, or None"""
+        tasks = self.tasks
+        if self._positions is not None:
+            pos = self._positions.get(task_id)
+            if pos is not None and pos < len(tasks) and tasks[pos].id == task_id:
+                return pos
+
+        # Missing, stale or a miss: rebuild from the list as it is now
+        positions: Dict[str, int] = {}
+        for pos, t in enumerate(tasks):
+            positions.setdefault(t.id, pos)
+        self._positions = positions
+        return positions.get(task_id)
+
     def add_task(self, task: Task) -> None:
-        """Add a task and update summary"""
+        """Add a task; the summary is recomputed when next read or dumped"""
         self.tasks.append(task)
-        self.update_summary()
+        if self._positions is not None:
+            self._positions.setdefault(task.id, len(self.tasks) - 1)
+        self._summary_dirty = True
+        self._groups.clear()
 
     def remove_task(self, task_id: str) -> bool:
-        """Remove a task by ID and update summary"""
-        original_length = len(self.tasks)
+        """Remove a task by ID; the summary is recomputed when next read or dumped"""
+        if self._find(task_id) is None:
+            return False
+        # Assigning the list drops the positions, groupings and summary
         self.tasks = [t for t in self.tasks if t.id != task_id]
-        if len(self.tasks) < original_length:
-            self.update_summary()
-            return True
-        return False
+        return True
+
+    def upsert_task(self, task: Task) -> None:
+        """Replace the task with the same ID, or add it if it is new"""
+        pos = self._find(task.id)
+        if pos is None:
+            self.add_task(task)
+            return
+        self.tasks[pos] = task
+        self._summary_dirty = True
+        self._groups.clear()
+
+    def apply_journal(self, raw: bytes) -> int:
+        """
+        Replay a JSON Lines journal of task snapshots (one Task per line)
+
+        Later lines win, so the newest version of each task is kept. A torn
+        final line from an interrupted append is ignored; a corrupt line
+        anywhere else raises ValueError, so no edit is dropped silently.
+        Returns the number of entries applied.
+        """
+        lines = [line for line in raw.splitlines() if line.strip()]
+        applied = 0
+        for number, line in enumerate(lines, 1):
+            try:
+                task = Task.model_validate_json(line)
+            except ValueError as e:
+                if number == len(lines):
+                    break
+                raise ValueError(f"Corrupt journal entry {number} of {len(lines)}: {e}") from e
+            self.upsert_task(task)
+            applied += 1
+        return applied
 
     def get_task(self, task_id: str) -> Optional[Task]:
         """Get a task by ID"""
-        for task in self.tasks:
-            if task.id == task_id:
-                return task
-        return None
+        pos = self._find(task_id)
+        return None if pos is None else self.tasks[pos]
 
     def update_summary(self) -> None:
         """Recalculate summary from current tasks"""
-        self.summary = DaySummary.from_tasks(self.tasks)
+        self.stored_summary = DaySummary.from_tasks(self.tasks)
+        self._summary_dirty = False
+        # Summaries are recomputed after task edits, so groupings may be stale too
+        self._groups.clear()
+
+    def refresh_summary(self) -> DaySummary:
+        """Recalculate summary only if tasks were added or removed since the last one"""
+        if self._summary_dirty:
+            self.update_summary()
+        return self.stored_summary
+
+    def invalidate_indexes(self) -> None:
+        """Drop cached groupings after editing a task's priority/status/time block or the `tasks` list in place"""
+        self._groups.clear()
+
+    def _grouped(self, field: str) -> Dict[Any, List[Task]]:
+        """Return tasks grouped by a field, building the grouping on first use"""
+        groups = self._groups.get(field)
+        if groups is None:
+            groups = {}
+            for t in self.tasks:
+                groups.setdefault(getattr(t, field), []).append(t)
+            self._groups[field] = groups
+        return groups
 
     def get_tasks_by_priority(self, priority: Priority) -> List[Task]:
         """Get all tasks with specific priority"""
-        return [t for t in self.tasks if t.priority == priority]
+        return list(self._grouped('priority').get(priority, ()))
 
     def get_tasks_by_status(self, status: TaskStatus) -> List[Task]:
         """Get all tasks with specific status"""
-        return [t for t in self.tasks if t.status == status]
+        return list(self._grouped('status').get(status, ()))
 
     def get_tasks_by_time_block(self, time_block: TimeBlock) -> List[Task]:
         """Get all tasks scheduled for specific time block"""
-        return [t for t in self.tasks if t.time_block == time_block]
+        return list(self._grouped('time_block').get(time_block, ()))
 
 
 class Objective(BaseModel):
     """User objectives for priority alignment"""
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     title: str = Field(..., min_length=1, max_length=100)
     description: str = Field(default="", max_length=500)
     weight: float = Field(default=1.0, ge=0.1, le=10.0)  # Higher = more important
@@ -283,6 +429,7 @@ class Config(BaseModel):
         "xlarge": 120
     })
     preferences: Dict[str, Any] = Field(default_factory=dict)
+    sub_agent_settings: Dict[str, Dict[str, Any]] = Field(default_factory=dict)
 
 
 # Type aliases for convenience
@@ -28,6 +28,76 @@ CREATE TRIGGER update_daily_tasks_updated_at
     FOR EACH ROW
     EXECUTE FUNCTION update_updated_at_column();
 
+-- Derive summary from tasks on every write, so a stale client can never
+-- overwrite it with an out-of-date one. Mirrors models.DaySummary.from_tasks.
+-- On an existing database, run just this function and trigger, then set
+-- SYNC_SERVER_SUMMARY=1 so sync_improved stops sending summary.
+CREATE OR REPLACE FUNCTION compute_daily_tasks_summary()
+RETURNS TRIGGER AS $$
+DECLARE
+    totals JSONB;
+    categories JSONB;
+    priorities JSONB;
+BEGIN
+    SELECT jsonb_build_object(
+        'total_tasks', count(*),
+        'completed_tasks', count(*) FILTER (WHERE t->>'status' = 'completed'),
+        'in_progress_tasks', count(*) FILTER (WHERE t->>'status' = 'in_progress'),
+        'blocked_tasks', count(*) FILTER (WHERE t->>'status' = 'blocked'),
+        'total_estimated_minutes', COALESCE(sum(COALESCE((t->>'estimated_minutes')::int, 30)), 0),
+        'total_actual_minutes', COALESCE(sum(COALESCE((t->>'actual_minutes')::int, 0)), 0),
+        'completion_percentage', CASE WHEN count(*) = 0 THEN 0.0
+            ELSE round(count(*) FILTER (WHERE t->>'status' = 'completed') * 100.0 / count(*), 1)
+        END
+    )
+    INTO totals
+    FROM jsonb_array_elements(NEW.tasks) t;
+
+    SELECT COALESCE(jsonb_object_agg(k, n), '{}'::jsonb) INTO categories
+    FROM (
+        SELECT COALESCE(t->>'category', 'admin') AS k, count(*) AS n
+        FROM jsonb_array_elements(NEW.tasks) t
+        GROUP BY 1
+    ) c;
+
+    SELECT COALESCE(jsonb_object_agg(k, n), '{}'::jsonb) INTO priorities
+    FROM (
+        SELECT COALESCE(t->>'priority', 'P2') AS k, count(*) AS n
+        FROM jsonb_array_elements(NEW.tasks) t
+        GROUP BY 1
+    ) p;
+
+    NEW.summary = totals
+        || jsonb_build_object('categories', categories, 'priorities', priorities);
+    RETURN NEW;
+END;
+$$ language 'plpgsql';
+
+DROP TRIGGER IF EXISTS compute_daily_tasks_summary ON daily_tasks;
+CREATE TRIGGER compute_daily_tasks_summary
+    BEFORE INSERT OR UPDATE ON daily_tasks
+    FOR EACH ROW
+    EXECUTE FUNCTION compute_daily_tasks_summary();
+
+-- Set-based bulk upsert used by sync_improved.push_tasks_smart_bulk: one
+-- statement and one plan per batch instead of row-by-row ON CONFLICT.
+-- summary may be omitted; the trigger above derives it from tasks.
+CREATE OR REPLACE FUNCTION bulk_upsert_daily_tasks(rows JSONB)
+RETURNS INTEGER
+LANGUAGE sql
+AS $$
+    WITH upserted AS (
+        INSERT INTO daily_tasks (date, tasks, summary)
+        SELECT (r->>'date')::date, r->'tasks', COALESCE(r->'summary', '{}'::jsonb)
+        FROM jsonb_array_elements(rows) r
+        ON CONFLICT (date) DO UPDATE
+            SET tasks = EXCLUDED.tasks,
+                summary = EXCLUDED.summary
+        RETURNING 1
+    )
+    SELECT count(*)::int FROM upserted;
+$$;
+
 -- Indexes for better performance
 CREATE INDEX idx_daily_tasks_date ON daily_tasks(date);
 CREATE INDEX idx_daily_tasks_created_at ON daily_tasks(created_at);
@@ -8,26 +8,59 @@ Handles real-time subscriptions and local file caching.
 import os
 import json
 import asyncio
-from datetime import date, datetime
-from typing import List, Dict, Optional, Callable, Any
+import tempfile
+from datetime import date, datetime, timedelta
+from typing import List, Dict, Optional, Callable, Any, Tuple
 from pathlib import Path
 from dataclasses import dataclass
 
 try:
-    from supabase import create_client, Client
-    from dotenv import load_dotenv
+    import httpx
+    from supabase import create_client, acreate_client, Client, AsyncClient, ClientOptions, AsyncClientOptions
+    if __package__:
+        from ._env import _env
+        from ._http import _httpx_settings
+    else:
+        from _env import _env
+        from _http import _httpx_settings
 except ImportError as e:
     print(f"Missing dependencies: {e}")
     print("Install with: pip install supabase python-dotenv")
     exit(1)
 
-from models import Task, DailyTasks, DaySummary
+from pydantic import TypeAdapter
+from pydantic_core import to_json
 
-# Load environment variables
-load_dotenv(Path(__file__).parent / '.env')
+# Works both as part of the backend package and when run as a script from backend/
+if __package__:
+    from .models import Task, DailyTasks, DaySummary, Priority, TaskStatus, Category, TimeBlock
+else:
+    from models import Task, DailyTasks, DaySummary, Priority, TaskStatus, Category, TimeBlock
 
+# Built once and reused; validates/dumps a whole task list in one call
+_TASKS_ADAPTER = TypeAdapter(List[Task])
 
-@dataclass
+# Field names accepted by update_task
+_TASK_FIELDS = frozenset(Task.model_fields)
+
+# Enum-typed Task fields; update_task coerces raw values so enum members stay
+# singletons and identity comparisons in the models keep working
+_TASK_ENUM_FIELDS = {
+    'priority': Priority,
+    'status': TaskStatus,
+    'category': Category,
+    'time_block': TimeBlock,
+}
+
+# Only the columns DailyTasks uses; skips id/created_at/updated_at on every pull
+DAILY_TASKS_COLUMNS = 'date,tasks,summary'
+
+# Journaled task edits replayed on load before the snapshot is rewritten
+JOURNAL_COMPACT_THRESHOLD = 50
+
+
+
+@dataclass(slots=True)
 class SyncResult:
     """Result of a sync operation"""
     success: bool
@@ -41,8 +74,7 @@ class TaskSync:
 
     def __init__(self, data_dir: str = "data"):
         """Initialize sync client"""
-        self.supabase_url = os.getenv('SUPABASE_URL')
-        self.supabase_key = os.getenv('SUPABASE_KEY')
+        self.supabase_url, self.supabase_key = _env()
 
         if not self.supabase_url or not self.supabase_key:
             raise ValueError(
@@ -50,7 +82,12 @@ class TaskSync:
             )
 
         try:
-            self.supabase: Client = create_client(self.supabase_url, self.supabase_key)
+            # One pooled httpx client per instance; every push/pull reuses its connections
+            self.supabase: Client = create_client(
+                self.supabase_url,
+                self.supabase_key,
+                options=ClientOptions(httpx_client=httpx.Client(**_httpx_settings()))
+            )
         except Exception as e:
             raise ConnectionError(f"Failed to connect to Supabase: {e}")
 
@@ -66,23 +103,129 @@ class TaskSync:
 
         self.active_subscriptions = []
 
-    def _save_local_copy(self, daily_tasks: DailyTasks) -> None:
-        """Save a local copy of daily tasks"""
+        # Async client is created on first use by the a* coroutine variants
+        self._async_supabase: Optional[AsyncClient] = None
+
+    async def _get_async_client(self) -> AsyncClient:
+        """Return the shared async Supabase client, creating it on first use"""
+        if self._async_supabase is None:
+            self._async_supabase = await acreate_client(
+                self.supabase_url,
+                self.supabase_key,
+                options=AsyncClientOptions(httpx_client=httpx.AsyncClient(**_httpx_settings()))
+            )
+        return self._async_supabase
+
+    async def aclose(self) -> None:
+        """Close the async client so the next event loop starts with a fresh one"""
+        if self._async_supabase is not None:
+            client, self._async_supabase = self._async_supabase, None
+            await client.postgrest.aclose()
+
+    @staticmethod
+    def _build_push_payload(tasks: List[Task], target_date: str) -> Tuple[DailyTasks, Dict[str, Any]]:
+        """Build the DailyTasks model and the Supabase row for a push"""
+        daily_tasks = DailyTasks(date=target_date, tasks=tasks)
+        daily_tasks.update_summary()
+
+        # Serialized once; the same dict is sent to Supabase and written to the cache
+        task_data = daily_tasks.model_dump(mode='json')
+        return daily_tasks, task_data
+
+    @staticmethod
+    def _push_result(response, task_count: int, target_date: str) -> SyncResult:
+        """Convert an upsert response into a SyncResult"""
+        if response.data:
+            return SyncResult(
+                success=True,
+                message=f"Successfully pushed {task_count} tasks for {target_date}",
+                data=response.data[0]
+            )
+        return SyncResult(
+            success=False,
+            message=f"Failed to push tasks for {target_date}",
+            error="No data returned from Supabase"
+        )
+
+    @staticmethod
+    def _daily_tasks_from_row(row: Dict[str, Any]) -> DailyTasks:
+        """Validate a daily_tasks row returned by Supabase"""
+        # Tasks are still validated so enums and subtasks are coerced to models;
+        # the summary is plain numbers we computed on push, so it is trusted
+        return DailyTasks(
+            date=row['date'],
+            tasks=_TASKS_ADAPTER.validate_python(row['tasks']),
+            summary=DaySummary.model_construct(**(row.get('summary') or {}))
+        )
+
+    def _save_local_copy(self, daily_tasks: DailyTasks, payload: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Save a local copy of daily tasks
+
+        If `payload` is given it must be daily_tasks.model_dump(mode='json')
+        already built by the caller, and is written as-is.
+        """
         file_path = self.daily_dir / f"{daily_tasks.date}.json"
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(daily_tasks.model_dump(), f, indent=2, default=str)
+            # Serialize with pydantic-core directly; no default=str hook or Python indent encoder
+            if payload is not None:
+                content = to_json(payload, indent=2)
+            else:
+                content = daily_tasks.model_dump_json(indent=2).encode('utf-8')
+
+            # Skip the write when the cache already holds identical bytes
+            # (e.g. a realtime no-op echo of our own push)
+            try:
+                unchanged = file_path.stat().st_size == len(content) and file_path.read_bytes() == content
+            except FileNotFoundError:
+                unchanged = False
+
+            if not unchanged:
+                # Write to a unique temp file and swap it in atomically so a crash
+                # mid-write never leaves a torn cache file behind, and concurrent
+                # writers for the same day never share a temp path
+                fd, tmp_path = tempfile.mkstemp(dir=self.daily_dir, suffix='.tmp')
+                try:
+                    with os.fdopen(fd, 'wb') as f:
+                        f.write(content)
+                    os.replace(tmp_path, file_path)
+                except BaseException:
+                    Path(tmp_path).unlink(missing_ok=True)
+                    raise
+
+            # The snapshot now holds the full state, so pending journal entries are folded in
+            self._journal_path(daily_tasks.date).unlink(missing_ok=True)
         except Exception as e:
             print(f"Warning: Failed to save local copy: {e}")
 
+    def _journal_path(self, target_date: str) -> Path:
+        """Path of the append-only journal of single-task edits for a day"""
+        return self.daily_dir / f"{target_date}.journal.jsonl"
+
+    def _append_journal(self, target_date: str, task: Task) -> None:
+        """Record one edited task in the day's journal (O(1) write, no snapshot rewrite)"""
+        try:
+            with open(self._journal_path(target_date), 'ab') as f:
+                f.write(task.model_dump_json().encode('utf-8') + b'\n')
+        except Exception as e:
+            print(f"Warning: Failed to append to local journal: {e}")
+
     def _load_local_copy(self, target_date: str) -> Optional[DailyTasks]:
-        """Load tasks from local cache"""
+        """Load tasks from local cache, replaying any journaled task edits"""
         file_path = self.daily_dir / f"{target_date}.json"
         try:
             if file_path.exists():
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                return DailyTasks(**data)
+                # Parse and validate the raw bytes in one pass (skips the json.load dict hop)
+                daily_tasks = DailyTasks.model_validate_json(file_path.read_bytes())
+
+                journal_path = self._journal_path(target_date)
+                if journal_path.exists():
+                    applied = daily_tasks.apply_journal(journal_path.read_bytes())
+                    # Fold a long journal back into the snapshot
+                    if applied >= JOURNAL_COMPACT_THRESHOLD:
+                        self._save_local_copy(daily_tasks)
+
+                return daily_tasks
         except Exception as e:
             print(f"Warning: Failed to load local copy: {e}")
         return None
@@ -102,35 +245,73 @@ class TaskSync:
             target_date = date.today().isoformat()
 
         try:
-            # Create DailyTasks object
-            daily_tasks = DailyTasks(date=target_date, tasks=tasks)
-            daily_tasks.update_summary()
-
-            # Prepare data for Supabase
-            task_data = {
-                'date': target_date,
-                'tasks': [task.model_dump() for task in tasks],
-                'summary': daily_tasks.summary.model_dump()
-            }
+            daily_tasks, task_data = self._build_push_payload(tasks, target_date)
 
             # Save local copy first
-            self._save_local_copy(daily_tasks)
+            self._save_local_copy(daily_tasks, task_data)
 
-            # Push to Supabase using upsert (insert or update)
-            response = self.supabase.table('daily_tasks').upsert(task_data).execute()
+            # Push to Supabase using upsert (INSERT ... ON CONFLICT (date) DO UPDATE)
+            response = self.supabase.table('daily_tasks').upsert(task_data, on_conflict='date').execute()
+            return self._push_result(response, len(tasks), target_date)
 
-            if response.data:
-                return SyncResult(
-                    success=True,
-                    message=f"Successfully pushed {len(tasks)} tasks for {target_date}",
-                    data=response.data[0] if response.data else None
-                )
-            else:
-                return SyncResult(
-                    success=False,
-                    message=f"Failed to push tasks for {target_date}",
-                    error="No data returned from Supabase"
-                )
+        except Exception as e:
+            return SyncResult(
+                success=False,
+                message=f"Error pushing tasks for {target_date}",
+                error=str(e)
+            )
+
+    def push_and_verify(self, tasks: List[Task], target_date: str = None) -> SyncResult:
+        """
+        Push tasks and verify what Supabase stored, in one round trip
+
+        The upsert already returns the stored row (PostgREST return=representation),
+        so it is validated the way a pull would be instead of being read back.
+
+        Returns:
+            SyncResult with data={'tasks': stored task dicts, 'count': number stored}
+        """
+        if not target_date:
+            target_date = date.today().isoformat()
+
+        push_result = self.push_tasks(tasks, target_date)
+        if not push_result.success:
+            return push_result
+
+        try:
+            stored = self._daily_tasks_from_row(push_result.data)
+        except Exception as e:
+            return SyncResult(
+                success=False,
+                message=f"Pushed tasks for {target_date} but the stored row is invalid",
+                error=str(e)
+            )
+
+        return SyncResult(
+            success=True,
+            message=f"Pushed and verified {len(stored.tasks)} tasks for {target_date}",
+            data={'tasks': push_result.data['tasks'], 'count': len(stored.tasks)}
+        )
+
+    async def apush_tasks(self, tasks: List[Task], target_date: str = None) -> SyncResult:
+        """
+        Async variant of push_tasks
+
+        Uses the async Supabase client so several pushes (e.g. for different
+        dates) can be awaited concurrently with asyncio.gather.
+        """
+        if not target_date:
+            target_date = date.today().isoformat()
+
+        try:
+            daily_tasks, task_data = self._build_push_payload(tasks, target_date)
+
+            # Save local copy first, off the event loop
+            await asyncio.to_thread(self._save_local_copy, daily_tasks, task_data)
+
+            client = await self._get_async_client()
+            response = await client.table('daily_tasks').upsert(task_data, on_conflict='date').execute()
+            return self._push_result(response, len(tasks), target_date)
 
         except Exception as e:
             return SyncResult(
@@ -139,6 +320,42 @@ class TaskSync:
                 error=str(e)
             )
 
+    def _fetch_daily_tasks(self, target_date: str, use_cache: bool = True) -> Tuple[Optional[DailyTasks], str]:
+        """
+        Fetch validated daily tasks from local cache or Supabase
+
+        Validation happens exactly once here, at the point where data enters
+        the process; callers work with the returned model directly instead of
+        dumping it to a dict and validating it again.
+
+        Returns:
+            Tuple of (DailyTasks or None if no data exists, status message)
+        """
+        # Try local cache first if requested
+        if use_cache:
+            local_data = self._load_local_copy(target_date)
+            if local_data:
+                return local_data, f"Loaded {len(local_data.tasks)} tasks from local cache for {target_date}"
+
+        # Pull from Supabase. maybe_single() reports a missing row as empty data
+        # rather than raising, so exceptions here are real (network/API) errors
+        response = self.supabase.table('daily_tasks')\
+            .select(DAILY_TASKS_COLUMNS)\
+            .eq('date', target_date)\
+            .maybe_single()\
+            .execute()
+
+        if not response or not response.data:
+            return None, f"No tasks found for {target_date}"
+
+        # Create DailyTasks object for validation
+        daily_tasks = self._daily_tasks_from_row(response.data)
+
+        # Update local cache
+        self._save_local_copy(daily_tasks)
+
+        return daily_tasks, f"Pulled {len(daily_tasks.tasks)} tasks for {target_date}"
+
     def pull_tasks(self, target_date: str = None, use_cache: bool = True) -> SyncResult:
         """
         Pull tasks from Supabase
@@ -154,43 +371,18 @@ class TaskSync:
             target_date = date.today().isoformat()
 
         try:
-            # Try local cache first if requested
-            if use_cache:
-                local_data = self._load_local_copy(target_date)
-                if local_data:
-                    return SyncResult(
-                        success=True,
-                        message=f"Loaded {len(local_data.tasks)} tasks from local cache for {target_date}",
-                        data=local_data.model_dump()
-                    )
-
-            # Pull from Supabase
-            response = self.supabase.table('daily_tasks')\
-                .select('*')\
-                .eq('date', target_date)\
-                .single()\
-                .execute()
-
-            if response.data:
-                # Create DailyTasks object for validation
-                daily_tasks = DailyTasks(
-                    date=response.data['date'],
-                    tasks=[Task(**task) for task in response.data['tasks']],
-                    summary=DaySummary(**response.data.get('summary', {}))
-                )
-
-                # Update local cache
-                self._save_local_copy(daily_tasks)
+            daily_tasks, message = self._fetch_daily_tasks(target_date, use_cache)
 
+            if daily_tasks:
                 return SyncResult(
                     success=True,
-                    message=f"Pulled {len(daily_tasks.tasks)} tasks for {target_date}",
+                    message=message,
                     data=daily_tasks.model_dump()
                 )
             else:
                 return SyncResult(
                     success=False,
-                    message=f"No tasks found for {target_date}",
+                    message=message,
                     data={'date': target_date, 'tasks': [], 'summary': {}}
                 )
 
@@ -211,6 +403,145 @@ class TaskSync:
                 error=str(e)
             )
 
+    async def apull_tasks(self, target_date: str = None, use_cache: bool = True) -> SyncResult:
+        """
+        Async variant of pull_tasks
+
+        The cache read runs in a worker thread and the network fetch uses the
+        async Supabase client, so pulls for many dates can run concurrently.
+        """
+        if not target_date:
+            target_date = date.today().isoformat()
+
+        try:
+            if use_cache:
+                local_data = await asyncio.to_thread(self._load_local_copy, target_date)
+                if local_data:
+                    return SyncResult(
+                        success=True,
+                        message=f"Loaded {len(local_data.tasks)} tasks from local cache for {target_date}",
+                        data=local_data.model_dump()
+                    )
+
+            client = await self._get_async_client()
+            response = await client.table('daily_tasks')\
+                .select(DAILY_TASKS_COLUMNS)\
+                .eq('date', target_date)\
+                .maybe_single()\
+                .execute()
+
+            if not response or not response.data:
+                return SyncResult(
+                    success=False,
+                    message=f"No tasks found for {target_date}",
+                    data={'date': target_date, 'tasks': [], 'summary': {}}
+                )
+
+            daily_tasks = self._daily_tasks_from_row(response.data)
+            await asyncio.to_thread(self._save_local_copy, daily_tasks)
+
+            return SyncResult(
+                success=True,
+                message=f"Pulled {len(daily_tasks.tasks)} tasks for {target_date}",
+                data=daily_tasks.model_dump()
+            )
+
+        except Exception as e:
+            return SyncResult(
+                success=False,
+                message=f"Error pulling tasks for {target_date}",
+                error=str(e)
+            )
+
+    def _split_cached(self, dates: List[str], use_cache: bool) -> Tuple[Dict[str, SyncResult], List[str]]:
+        """Serve what the local cache can for a batch pull, returning the misses"""
+        results: Dict[str, SyncResult] = {}
+        missing: List[str] = []
+        for target_date in dates:
+            local_data = self._load_local_copy(target_date) if use_cache else None
+            if local_data:
+                results[target_date] = SyncResult(
+                    success=True,
+                    message=f"Loaded {len(local_data.tasks)} tasks from local cache for {target_date}",
+                    data=local_data.model_dump()
+                )
+            else:
+                missing.append(target_date)
+        return results, missing
+
+    def _merge_batch_rows(self, results: Dict[str, SyncResult], missing: List[str],
+                          rows: List[Dict[str, Any]]) -> None:
+        """Fill in batch results for the cache misses from the rows Supabase returned"""
+        by_date = {row['date']: row for row in rows}
+        for target_date in missing:
+            row = by_date.get(target_date)
+            if row is None:
+                results[target_date] = SyncResult(
+                    success=False,
+                    message=f"No tasks found for {target_date}",
+                    data={'date': target_date, 'tasks': [], 'summary': {}}
+                )
+                continue
+
+            daily_tasks = self._daily_tasks_from_row(row)
+            self._save_local_copy(daily_tasks)
+            results[target_date] = SyncResult(
+                success=True,
+                message=f"Pulled {len(daily_tasks.tasks)} tasks for {target_date}",
+                data=daily_tasks.model_dump()
+            )
+
+    def pull_tasks_batch(self, dates: List[str], use_cache: bool = True) -> Dict[str, SyncResult]:
+        """
+        Pull several dates at once
+
+        Dates served by the local cache are skipped; the rest are fetched
+        with a single IN query instead of one round trip per date.
+
+        Returns:
+            Dict of date -> SyncResult, in the order the dates were given
+        """
+        results, missing = self._split_cached(dates, use_cache)
+
+        if missing:
+            try:
+                response = self.supabase.table('daily_tasks')\
+                    .select(DAILY_TASKS_COLUMNS)\
+                    .in_('date', missing)\
+                    .execute()
+                self._merge_batch_rows(results, missing, response.data or [])
+            except Exception as e:
+                for target_date in missing:
+                    results.setdefault(target_date, SyncResult(
+                        success=False,
+                        message=f"Error pulling tasks for {target_date}",
+                        error=str(e)
+                    ))
+
+        return {target_date: results[target_date] for target_date in dates}
+
+    async def apull_tasks_batch(self, dates: List[str], use_cache: bool = True) -> Dict[str, SyncResult]:
+        """Async variant of pull_tasks_batch, using the shared async client"""
+        results, missing = await asyncio.to_thread(self._split_cached, dates, use_cache)
+
+        if missing:
+            try:
+                client = await self._get_async_client()
+                response = await client.table('daily_tasks')\
+                    .select(DAILY_TASKS_COLUMNS)\
+                    .in_('date', missing)\
+                    .execute()
+                await asyncio.to_thread(self._merge_batch_rows, results, missing, response.data or [])
+            except Exception as e:
+                for target_date in missing:
+                    results.setdefault(target_date, SyncResult(
+                        success=False,
+                        message=f"Error pulling tasks for {target_date}",
+                        error=str(e)
+                    ))
+
+        return {target_date: results[target_date] for target_date in dates}
+
     def update_task(self, task_id: str, updates: Dict[str, Any], target_date: str = None) -> SyncResult:
         """
         Update a specific task
@@ -227,34 +558,54 @@ class TaskSync:
             target_date = date.today().isoformat()
 
         try:
-            # Pull current tasks
-            result = self.pull_tasks(target_date)
-            if not result.success:
-                return result
-
-            daily_tasks = DailyTasks(**result.data)
+            # Fetch current tasks as a validated model (no dump/re-validate round trip)
+            daily_tasks, message = self._fetch_daily_tasks(target_date)
+            if not daily_tasks:
+                return SyncResult(
+                    success=False,
+                    message=message,
+                    data={'date': target_date, 'tasks': [], 'summary': {}}
+                )
 
             # Find and update the task
-            task_found = False
-            for task in daily_tasks.tasks:
-                if task.id == task_id:
-                    # Apply updates
-                    for key, value in updates.items():
-                        if hasattr(task, key):
-                            setattr(task, key, value)
-                    task.updated_at = datetime.now().isoformat()
-                    task_found = True
-                    break
-
-            if not task_found:
+            task = daily_tasks.get_task(task_id)
+            if task is None:
                 return SyncResult(
                     success=False,
                     message=f"Task {task_id} not found in {target_date}",
                     error="Task not found"
                 )
 
-            # Push updated tasks
-            return self.push_tasks(daily_tasks.tasks, target_date)
+            # Apply updates in one batch, keeping only known Task fields.
+            # The instance is updated in place since the ID index holds it.
+            vetted = {key: value for key, value in updates.items() if key in _TASK_FIELDS}
+            for key, enum_type in _TASK_ENUM_FIELDS.items():
+                if vetted.get(key) is not None:
+                    vetted[key] = enum_type(vetted[key])
+            vetted['updated_at'] = datetime.now().isoformat()
+            task.__dict__.update(vetted)
+            task.__pydantic_fields_set__.update(vetted)
+            daily_tasks.invalidate_indexes()
+            daily_tasks.update_summary()
+            payload = daily_tasks.model_dump(mode='json')
+
+            # Journal the single edited task locally instead of rewriting the day
+            self._append_journal(target_date, task)
+
+            # The row normally exists already, so issue a targeted UPDATE of
+            # the JSON columns instead of a full upsert
+            row = {'tasks': payload['tasks'], 'summary': payload['summary']}
+            response = self.supabase.table('daily_tasks')\
+                .update(row)\
+                .eq('date', target_date)\
+                .execute()
+
+            if not response.data:
+                # Day only exists in the local cache; create the row
+                row['date'] = target_date
+                response = self.supabase.table('daily_tasks').upsert(row, on_conflict='date').execute()
+
+            return self._push_result(response, len(daily_tasks.tasks), target_date)
 
         except Exception as e:
             return SyncResult(
@@ -286,11 +637,7 @@ class TaskSync:
                 if payload.get('new', {}).get('date') == target_date:
                     # Update local cache
                     data = payload['new']
-                    daily_tasks = DailyTasks(
-                        date=data['date'],
-                        tasks=[Task(**task) for task in data['tasks']],
-                        summary=DaySummary(**data.get('summary', {}))
-                    )
+                    daily_tasks = self._daily_tasks_from_row(data)
                     self._save_local_copy(daily_tasks)
 
                     # Call user callback
@@ -340,17 +687,41 @@ class TaskSync:
         self.active_subscriptions.clear()
 
     def get_task_history(self, days: int = 7) -> List[Dict]:
-        """Get task history for the last N days"""
-        history = []
+        """
+        Get task history for the last N days
+
+        Dates found in the local cache are served from disk; all remaining
+        dates are fetched from Supabase in a single batched query instead of
+        one round-trip per day.
+        """
         current_date = date.today()
+        dates = [(current_date - timedelta(days=i)).isoformat() for i in range(days)]
+
+        by_date: Dict[str, Dict] = {}
+        missing = []
+        for target_date in dates:
+            local_data = self._load_local_copy(target_date)
+            if local_data:
+                by_date[target_date] = local_data.model_dump()
+            else:
+                missing.append(target_date)
+
+        if missing:
+            try:
+                response = self.supabase.table('daily_tasks')\
+                    .select(DAILY_TASKS_COLUMNS)\
+                    .in_('date', missing)\
+                    .execute()
 
-        for i in range(days):
-            target_date = (current_date - datetime.timedelta(days=i)).isoformat()
-            result = self.pull_tasks(target_date, use_cache=True)
-            if result.success and result.data:
-                history.append(result.data)
+                for row in response.data or []:
+                    daily_tasks = self._daily_tasks_from_row(row)
+                    self._save_local_copy(daily_tasks)
+                    by_date[daily_tasks.date] = daily_tasks.model_dump()
+            except Exception as e:
+                print(f"Warning: Failed to fetch task history from Supabase: {e}")
 
-        return history
+        # Preserve newest-first ordering
+        return [by_date[d] for d in dates if d in by_date]
 
 
 # CLI Interface
@@ -384,14 +755,14 @@ def main():
                 print(f"Error: File {file_path} not found")
                 sys.exit(1)
 
-            with open(file_path, 'r') as f:
-                task_data = json.load(f)
+            # Parse and validate straight from bytes; no json.load dict hop
+            raw = Path(file_path).read_bytes()
 
-            if isinstance(task_data, list):
-                tasks = [Task(**t) for t in task_data]
+            if raw.lstrip()[:1] == b'[':
+                tasks = _TASKS_ADAPTER.validate_json(raw)
             else:
                 # Assume it's a DailyTasks object
-                daily_tasks = DailyTasks(**task_data)
+                daily_tasks = DailyTasks.model_validate_json(raw)
                 tasks = daily_tasks.tasks
 
             result = sync.push_tasks(tasks, target_date)
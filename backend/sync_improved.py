@@ -6,35 +6,119 @@ with comprehensive error handling and recovery procedures.
 This script addresses all the issues encountered in the original sync.py:
 1. Pydantic V2 compatibility (.model_dump() instead of .dict())
 2. Proper environment variable loading
-3. Database constraint handling (UPDATE vs INSERT)
+3. Database constraint handling (UPSERT on the unique date column)
 4. Better error reporting and recovery
 """
 
 import os
 import json
 import sys
+import time
+import asyncio
 import traceback
-from datetime import date, datetime
-from typing import List, Dict, Optional, Callable, Any
+import copy
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from typing import TYPE_CHECKING, List, Dict, Optional, Callable, Any, Tuple
+from collections import OrderedDict, deque
 from pathlib import Path
 from dataclasses import dataclass
 
-try:
-    from supabase import create_client, Client
-    from dotenv import load_dotenv
-except ImportError as e:
-    print(f"Missing dependencies: {e}")
-    print("Install with: pip install supabase python-dotenv")
-    exit(1)
-
-# Add current directory to path for imports
-sys.path.append(str(Path(__file__).parent))
-from models import Task, DailyTasks, DaySummary
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+# Works both as part of the backend package and when run as a script from backend/
+if __package__:
+    from ._env import _env
+    from ._http import _httpx_settings
+    from .models import Task, DailyTasks, DaySummary
+    from ._retry import with_retry, awith_retry
+else:
+    from _env import _env
+    from _http import _httpx_settings
+    from models import Task, DailyTasks, DaySummary
+    from _retry import with_retry, awith_retry
+
+if TYPE_CHECKING:
+    from supabase import Client, AsyncClient
+
+
+def _lazy_supabase():
+    """
+    Import supabase-py on first use
+
+    It pulls in httpx, auth, storage and realtime, which dominates startup
+    for commands that never touch the network (usage, --help).
+    """
+    try:
+        import supabase
+    except ImportError as e:
+        print(f"Missing dependencies: {e}")
+        print("Install with: pip install supabase python-dotenv")
+        exit(1)
+    return supabase
+
+# Built once and reused for bulk serialization of several days
+_DAYS_TA = TypeAdapter(List[DailyTasks])
+
+# Supabase credentials, read once (backend/.env is only parsed if they are not already set)
+SUPABASE_URL, SUPABASE_KEY = _env()
+
+# Max rows per bulk upsert request, keeps request bodies well under PostgREST limits
+BULK_CHUNK_SIZE = 200
+
+# Only the columns DailyTasks uses; skips id/created_at/updated_at on every pull
+DAILY_TASKS_COLUMNS = 'date,tasks,summary'
+
+# Trust local cache files written by this project and skip re-validating them on read
+TRUST_LOCAL = os.getenv('SYNC_TRUST_LOCAL', '1') == '1'
+
+# Set SYNC_SERVER_SUMMARY=1 once the summary trigger from schema.sql is installed, and
+# summary is derived by the database instead of sent over the wire. Off by default so
+# databases without the trigger keep getting a summary.
+SERVER_SIDE_SUMMARY = os.getenv('SYNC_SERVER_SUMMARY', '0') == '1'
+
+# Max in-flight requests for concurrent pulls/backfill pushes; returns flatten out past ~8
+PULL_CONCURRENCY = 8
+PUSH_CONCURRENCY = 8
+
+@lru_cache(maxsize=1)
+def get_supabase() -> "Client":
+    """
+    Return the process-wide Supabase client, creating it on first call
+
+    Scripts share this client so the HTTP connection pool and auth setup are
+    paid once per process instead of once per script or sync instance.
+    """
+    supabase_url, supabase_key = SUPABASE_URL, SUPABASE_KEY
+
+    # Enhanced environment validation
+    if not supabase_url:
+        raise ValueError(
+            "SUPABASE_URL not found. Check that backend/.env exists and contains SUPABASE_URL=your-url"
+        )
+    if not supabase_key:
+        raise ValueError(
+            "SUPABASE_KEY not found. Check that backend/.env exists and contains SUPABASE_KEY=your-key"
+        )
+
+    supabase = _lazy_supabase()
+    import httpx
 
-# Load environment variables from backend/.env (FIXED PATH)
-load_dotenv(Path(__file__).parent / '.env')
+    try:
+        return supabase.create_client(
+            supabase_url,
+            supabase_key,
+            options=supabase.ClientOptions(
+                postgrest_client_timeout=10,
+                schema='public',
+                httpx_client=httpx.Client(**_httpx_settings())
+            )
+        )
+    except Exception as e:
+        raise ValueError(f"Failed to create Supabase client: {e}")
 
-@dataclass
+@dataclass(slots=True)
 class SyncResult:
     """Enhanced result of a sync operation with detailed error info"""
     success: bool
@@ -47,25 +131,21 @@ class SyncResult:
 class ImprovedTaskSync:
     """Enhanced sync class with comprehensive error handling"""
 
+    # In-memory pull cache: seconds an entry stays fresh, and max dates kept
+    _CACHE_TTL = 30.0
+    _CACHE_MAX = 64
+
     def __init__(self, data_dir: str = "data"):
         """Initialize sync client with enhanced error checking"""
-        self.supabase_url = os.getenv('SUPABASE_URL')
-        self.supabase_key = os.getenv('SUPABASE_KEY')
+        self.supabase_url = SUPABASE_URL
+        self.supabase_key = SUPABASE_KEY
+        self.supabase: "Client" = get_supabase()
 
-        # Enhanced environment validation
-        if not self.supabase_url:
-            raise ValueError(
-                "SUPABASE_URL not found. Check that backend/.env exists and contains SUPABASE_URL=your-url"
-            )
-        if not self.supabase_key:
-            raise ValueError(
-                "SUPABASE_KEY not found. Check that backend/.env exists and contains SUPABASE_KEY=your-key"
-            )
+        # Async client for concurrent pulls, created on first use
+        self._async_supabase: Optional["AsyncClient"] = None
 
-        try:
-            self.supabase: Client = create_client(self.supabase_url, self.supabase_key)
-        except Exception as e:
-            raise ValueError(f"Failed to create Supabase client: {e}")
+        # date -> (monotonic fetch time, pulled data), least recently used first
+        self._mem_cache: "OrderedDict[str, Tuple[float, dict]]" = OrderedDict()
 
         # Set up directory paths
         self.data_dir = Path(data_dir)
@@ -80,7 +160,7 @@ class ImprovedTaskSync:
         """Test Supabase connection with detailed diagnostics"""
         try:
             # Test basic connection
-            response = self.supabase.table('daily_tasks').select('date').limit(1).execute()
+            response = with_retry(self.supabase.table('daily_tasks').select('date').limit(1).execute)
 
             return SyncResult(
                 success=True,
@@ -96,29 +176,51 @@ class ImprovedTaskSync:
                 suggested_fix="Check SUPABASE_URL and SUPABASE_KEY in backend/.env"
             )
 
-    def _record_exists(self, target_date: str) -> bool:
-        """Check if a record already exists for the given date"""
-        try:
-            response = self.supabase.table('daily_tasks')\
-                .select('date')\
-                .eq('date', target_date)\
-                .execute()
-
-            return len(response.data) > 0
-        except Exception:
-            return False
+    def _cache_get(self, target_date: str) -> Optional[dict]:
+        """Return a copy of recently pulled data for a date, or None if absent or expired"""
+        entry = self._mem_cache.get(target_date)
+        if entry is None:
+            return None
+        fetched_at, data = entry
+        if time.monotonic() - fetched_at >= self._CACHE_TTL:
+            del self._mem_cache[target_date]
+            return None
+        self._mem_cache.move_to_end(target_date)
+        # Callers get their own copy, so mutating a result can't poison later reads
+        return copy.deepcopy(data)
+
+    def _cache_put(self, target_date: str, data: dict) -> None:
+        """Remember a copy of pulled data for a date, evicting the least recently used"""
+        self._mem_cache[target_date] = (time.monotonic(), copy.deepcopy(data))
+        self._mem_cache.move_to_end(target_date)
+        while len(self._mem_cache) > self._CACHE_MAX:
+            self._mem_cache.popitem(last=False)
+
+    def _save_local_copy(self, daily_tasks: DailyTasks, payload: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Save a local copy with error handling
 
-    def _save_local_copy(self, daily_tasks: DailyTasks) -> None:
-        """Save a local copy with error handling"""
-        file_path = self.daily_dir / f"{daily_tasks.date}.json"
+        If `payload` is given it must be daily_tasks.model_dump(mode='json')
+        already built by the caller, and is written as-is.
+        """
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                # FIXED: Use model_dump() instead of .dict()
-                json.dump(daily_tasks.model_dump(), f, indent=2, default=str)
-            print(f"✅ Local copy saved: {file_path}")
+            # Serialize with pydantic-core (Rust) straight to bytes; same format as sync.py
+            if payload is not None:
+                content = to_json(payload, indent=2)
+            else:
+                content = daily_tasks.model_dump_json(indent=2).encode('utf-8')
+            self._write_local_json(daily_tasks.date, content)
         except Exception as e:
             print(f"⚠️ Warning: Failed to save local copy: {e}")
 
+    def _write_local_json(self, target_date: str, content: bytes) -> None:
+        """Write an already-serialized day (UTF-8 JSON) to data/daily"""
+        file_path = self.daily_dir / f"{target_date}.json"
+        file_path.write_bytes(content)
+        # Snapshot supersedes any task edits journaled by sync.update_task
+        (self.daily_dir / f"{target_date}.journal.jsonl").unlink(missing_ok=True)
+        print(f"✅ Local copy saved: {file_path}")
+
     def _load_local_copy(self, target_date: str) -> Optional[DailyTasks]:
         """Load local copy with validation"""
         file_path = self.daily_dir / f"{target_date}.json"
@@ -126,24 +228,57 @@ class ImprovedTaskSync:
             return None
 
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # Parse and validate with Pydantic in one pass, no json.load dict
+            daily_tasks = DailyTasks.model_validate_json(file_path.read_bytes())
+
+            # Replay single-task edits journaled by sync.update_task
+            journal_path = self.daily_dir / f"{target_date}.journal.jsonl"
+            if journal_path.exists():
+                daily_tasks.apply_journal(journal_path.read_bytes())
 
-            # Validate with Pydantic model
-            return DailyTasks(**data)
+            return daily_tasks
         except Exception as e:
             print(f"⚠️ Warning: Failed to load local copy: {e}")
             return None
 
+    @staticmethod
+    def _remote_row(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Row to upsert for a serialized day; summary is left out when the database trigger derives it"""
+        if SERVER_SIDE_SUMMARY:
+            return {'date': data['date'], 'tasks': data['tasks']}
+        return {'date': data['date'], 'tasks': data['tasks'], 'summary': data.get('summary', {})}
+
+    def _load_local_data(self, target_date: str) -> Optional[dict]:
+        """
+        Load a local copy as a plain dict for returning from pull paths
+
+        Files in data/daily are written by this project from validated models,
+        so with SYNC_TRUST_LOCAL=1 (the default) they are parsed without
+        re-running validation. Days with journaled edits still go through
+        _load_local_copy so the journal is replayed.
+        """
+        file_path = self.daily_dir / f"{target_date}.json"
+        journal_path = self.daily_dir / f"{target_date}.journal.jsonl"
+        if TRUST_LOCAL and not journal_path.exists():
+            try:
+                return json.loads(file_path.read_bytes())
+            except FileNotFoundError:
+                return None
+            except Exception as e:
+                print(f"⚠️ Warning: Failed to load local copy: {e}")
+                return None
+
+        daily_tasks = self._load_local_copy(target_date)
+        return daily_tasks.model_dump() if daily_tasks else None
+
     def push_tasks_smart(self, tasks: List[Task], target_date: str = None) -> SyncResult:
         """
         Smart push that handles existing records properly
 
         This method:
-        1. Checks if record exists
-        2. Uses UPDATE if exists, INSERT if new
-        3. Handles constraint violations gracefully
-        4. Provides detailed error reporting
+        1. Upserts on the unique date column in a single round trip
+        2. Handles constraint violations gracefully
+        3. Provides detailed error reporting
         """
         if not target_date:
             target_date = date.today().isoformat()
@@ -151,38 +286,41 @@ class ImprovedTaskSync:
         try:
             # Create DailyTasks object
             daily_tasks = DailyTasks(date=target_date, tasks=tasks)
-            daily_tasks.update_summary()
+        except Exception as e:
+            return self._error_result(f"❌ Error syncing tasks for {target_date}", e)
 
-            # Prepare data for Supabase (FIXED: Use model_dump())
-            task_data = {
-                'date': target_date,
-                'tasks': [task.model_dump() for task in tasks],
-                'summary': daily_tasks.summary.model_dump()
-            }
+        return self._push_daily(daily_tasks)
 
-            # Save local copy first
-            self._save_local_copy(daily_tasks)
+    def _push_daily(self, daily_tasks: DailyTasks, skip_save: bool = False) -> SyncResult:
+        """
+        Upsert an already-built DailyTasks
 
-            # Check if record exists
-            record_exists = self._record_exists(target_date)
+        skip_save=True skips rewriting the local copy, for callers whose
+        data was just read from that file.
+        """
+        target_date = daily_tasks.date
 
-            if record_exists:
-                print(f"📝 Updating existing record for {target_date}")
-                response = self.supabase.table('daily_tasks')\
-                    .update(task_data)\
-                    .eq('date', target_date)\
-                    .execute()
-            else:
-                print(f"➕ Creating new record for {target_date}")
-                response = self.supabase.table('daily_tasks')\
-                    .insert(task_data)\
-                    .execute()
+        try:
+            # Serialize once; the same dict is sent to Supabase and written locally.
+            # The dump recomputes the summary only if tasks changed since it was built
+            task_data = daily_tasks.model_dump(mode='json')
+
+            # Save local copy first
+            if not skip_save:
+                self._save_local_copy(daily_tasks, task_data)
+
+            # INSERT ... ON CONFLICT (date) DO UPDATE - no existence check round trip
+            print(f"📝 Upserting record for {target_date}")
+            response = with_retry(self.supabase.table('daily_tasks')\
+                .upsert(self._remote_row(task_data), on_conflict='date')\
+                .execute)
+            self._mem_cache.pop(target_date, None)
 
             if response.data:
                 return SyncResult(
                     success=True,
-                    message=f"✅ Successfully {'updated' if record_exists else 'created'} {len(tasks)} tasks for {target_date}",
-                    data=response.data[0] if response.data else None
+                    message=f"✅ Successfully upserted {len(daily_tasks.tasks)} tasks for {target_date}",
+                    data=response.data[0]
                 )
             else:
                 return SyncResult(
@@ -194,29 +332,97 @@ class ImprovedTaskSync:
                 )
 
         except Exception as e:
-            error_message = str(e)
-            error_type = "unknown_error"
-            suggested_fix = "Check logs for details"
-
-            # Provide specific fixes for common errors
-            if "duplicate key" in error_message.lower():
-                error_type = "constraint_violation"
-                suggested_fix = "Record already exists. Try using UPDATE instead of INSERT."
-            elif "permission" in error_message.lower():
-                error_type = "permission_error"
-                suggested_fix = "Check Supabase API key permissions"
-            elif "network" in error_message.lower() or "connection" in error_message.lower():
-                error_type = "network_error"
-                suggested_fix = "Check internet connection and Supabase URL"
+            return self._error_result(f"❌ Error syncing tasks for {target_date}", e)
+
+    def push_tasks_smart_bulk(self, payloads: List[DailyTasks]) -> SyncResult:
+        """
+        Push several days in as few requests as possible
 
+        Each chunk of BULK_CHUNK_SIZE days goes to the bulk_upsert_daily_tasks
+        RPC (see schema.sql), a single set-based INSERT ... ON CONFLICT. So M
+        days cost ceil(M / BULK_CHUNK_SIZE) round trips instead of M.
+        Databases without the function fall back to a PostgREST upsert.
+        """
+        if not payloads:
+            return SyncResult(success=True, message="📭 Nothing to push", data={'dates': [], 'upserted': 0})
+
+        try:
+            for daily_tasks in payloads:
+                daily_tasks.update_summary()
+            # One serializer call over every day rather than one per day
+            rows = _DAYS_TA.dump_python(payloads, mode='json')
+
+            # Save local copies first, in parallel since each is its own file
+            with ThreadPoolExecutor(max_workers=min(8, len(payloads))) as pool:
+                list(pool.map(self._save_local_copy, payloads, rows))
+
+            upserted = 0
+            for start in range(0, len(rows), BULK_CHUNK_SIZE):
+                chunk = [self._remote_row(row) for row in rows[start:start + BULK_CHUNK_SIZE]]
+                upserted += self._bulk_upsert(chunk)
+                for row in chunk:
+                    self._mem_cache.pop(row['date'], None)
+
+            dates = [row['date'] for row in rows]
+            if upserted == len(rows):
+                return SyncResult(
+                    success=True,
+                    message=f"✅ Successfully upserted {len(rows)} days",
+                    data={'dates': dates, 'upserted': upserted}
+                )
             return SyncResult(
                 success=False,
-                message=f"❌ Error syncing tasks for {target_date}",
-                error=error_message,
-                error_type=error_type,
-                suggested_fix=suggested_fix
+                message=f"❌ Only {upserted} of {len(rows)} days were synced",
+                data={'dates': dates, 'upserted': upserted},
+                error="Supabase returned fewer rows than were sent",
+                error_type="database_error",
+                suggested_fix="Check Supabase table permissions and schema"
             )
 
+        except Exception as e:
+            return self._error_result(f"❌ Error syncing {len(payloads)} days", e)
+
+    def _bulk_upsert(self, rows: List[Dict[str, Any]]) -> int:
+        """Upsert rows in one statement and return how many were written"""
+        try:
+            response = with_retry(self.supabase.rpc('bulk_upsert_daily_tasks', {'rows': rows}).execute)
+            return int(response.data or 0)
+        except Exception as e:
+            # Function not installed yet (PostgREST reports PGRST202); use a plain upsert.
+            # Anything else, including errors raised inside the function, is a real failure
+            if getattr(e, 'code', None) != 'PGRST202':
+                raise
+        response = with_retry(self.supabase.table('daily_tasks')\
+            .upsert(rows, on_conflict='date')\
+            .execute)
+        return len(response.data or [])
+
+    @staticmethod
+    def _error_result(message: str, e: Exception) -> SyncResult:
+        """Build a failed SyncResult with a specific fix for common errors"""
+        error_message = str(e)
+        error_type = "unknown_error"
+        suggested_fix = "Check logs for details"
+
+        # Provide specific fixes for common errors
+        if "duplicate key" in error_message.lower():
+            error_type = "constraint_violation"
+            suggested_fix = "Ensure daily_tasks.date has its UNIQUE constraint (see backend/schema.sql)"
+        elif "permission" in error_message.lower():
+            error_type = "permission_error"
+            suggested_fix = "Check Supabase API key permissions"
+        elif "network" in error_message.lower() or "connection" in error_message.lower():
+            error_type = "network_error"
+            suggested_fix = "Check internet connection and Supabase URL"
+
+        return SyncResult(
+            success=False,
+            message=message,
+            error=error_message,
+            error_type=error_type,
+            suggested_fix=suggested_fix
+        )
+
     def push_tasks_from_file(self, target_date: str = None) -> SyncResult:
         """Push tasks from local daily file with validation"""
         if not target_date:
@@ -232,50 +438,144 @@ class ImprovedTaskSync:
                 suggested_fix=f"Create data/daily/{target_date}.json with task data"
             )
 
-        return self.push_tasks_smart(daily_tasks.tasks, target_date)
+        # The file is the source, so there is nothing to write back
+        return self._push_daily(daily_tasks, skip_save=True)
+
+    def push_raw_from_file(self, file_path: Path) -> SyncResult:
+        """
+        Push a daily file without building Task models
+
+        The file is parsed once and only its top-level shape is checked
+        before the dict goes straight to the upsert. Use push_tasks_from_file
+        for full model validation.
+        """
+        file_path = Path(file_path)
+        journal_path = file_path.with_name(f"{file_path.stem}.journal.jsonl")
+        if journal_path.exists():
+            # Pending journaled edits only exist after replay through the models
+            return self.push_tasks_from_file(file_path.stem)
+
+        try:
+            data = json.loads(file_path.read_bytes())
+        except FileNotFoundError:
+            return SyncResult(
+                success=False,
+                message=f"❌ No local file found at {file_path}",
+                error_type="file_not_found",
+                suggested_fix=f"Create {file_path} with task data"
+            )
+        except ValueError as e:
+            return SyncResult(
+                success=False,
+                message=f"❌ {file_path} is not valid JSON",
+                error=str(e),
+                error_type="validation_error",
+                suggested_fix="Fix the file or re-pull it from Supabase"
+            )
+
+        problem = _raw_shape_problem(data)
+        if problem:
+            return SyncResult(
+                success=False,
+                message=f"❌ {file_path} does not look like a daily task file",
+                error=problem,
+                error_type="validation_error",
+                suggested_fix="Run push with --validate for a detailed report"
+            )
+
+        target_date = data['date']
+        try:
+            print(f"📝 Upserting record for {target_date}")
+            response = with_retry(self.supabase.table('daily_tasks')\
+                .upsert(self._remote_row(data), on_conflict='date')\
+                .execute)
+            self._mem_cache.pop(target_date, None)
+        except Exception as e:
+            return self._error_result(f"❌ Error syncing tasks for {target_date}", e)
 
-    def pull_tasks(self, target_date: str = None, use_cache: bool = False) -> SyncResult:
-        """Pull tasks from Supabase with fallback to local cache"""
+        if response.data:
+            return SyncResult(
+                success=True,
+                message=f"✅ Successfully upserted {len(data['tasks'])} tasks for {target_date}",
+                data=response.data[0]
+            )
+        return SyncResult(
+            success=False,
+            message=f"❌ Failed to sync tasks for {target_date}",
+            error="No data returned from Supabase",
+            error_type="database_error",
+            suggested_fix="Check Supabase table permissions and schema"
+        )
+
+    def pull_tasks(self, target_date: str = None, use_cache: bool = False, lazy: bool = True) -> SyncResult:
+        """
+        Pull tasks from Supabase with fallback to local cache
+
+        With lazy=True (the default) the REST row is written to the local copy
+        and returned as-is, without building a DailyTasks model. Pass
+        lazy=False to validate the row through the model first.
+        """
         if not target_date:
             target_date = date.today().isoformat()
 
         try:
             # Try local cache first if requested
             if use_cache:
-                local_data = self._load_local_copy(target_date)
+                local_data = self._load_local_data(target_date)
                 if local_data:
                     return SyncResult(
                         success=True,
-                        message=f"📁 Loaded {len(local_data.tasks)} tasks from local cache for {target_date}",
-                        data=local_data.model_dump()  # FIXED: Use model_dump()
+                        message=f"📁 Loaded {len(local_data['tasks'])} tasks from local cache for {target_date}",
+                        data=local_data
                     )
 
+            # Recently pulled data skips the network round trip
+            cached = self._cache_get(target_date)
+            if cached is not None:
+                return SyncResult(
+                    success=True,
+                    message=f"⚡ Loaded {len(cached['tasks'])} tasks from memory for {target_date}",
+                    data=cached
+                )
+
             # Pull from Supabase
-            response = self.supabase.table('daily_tasks')\
-                .select('*')\
+            response = with_retry(self.supabase.table('daily_tasks')\
+                .select(DAILY_TASKS_COLUMNS)\
                 .eq('date', target_date)\
-                .execute()
-
-            if response.data:
-                # Convert to DailyTasks object for validation
-                daily_tasks = DailyTasks(**response.data[0])
-
-                # Save local copy
-                self._save_local_copy(daily_tasks)
-
+                .maybe_single()\
+                .execute)
+
+            if response and response.data:
+                if lazy:
+                    # Persist and return the REST row directly; no model round trip
+                    data = response.data
+                    try:
+                        self._write_local_json(target_date, to_json(data, indent=2))
+                    except Exception as e:
+                        print(f"⚠️ Warning: Failed to save local copy: {e}")
+                else:
+                    # Convert to DailyTasks object for validation
+                    daily_tasks = DailyTasks.model_validate(response.data)
+
+                    # Save local copy
+                    self._save_local_copy(daily_tasks)
+
+                    data = daily_tasks.model_dump()  # FIXED: Use model_dump()
+
+                self._cache_put(target_date, data)
                 return SyncResult(
                     success=True,
-                    message=f"📥 Pulled {len(daily_tasks.tasks)} tasks for {target_date}",
-                    data=daily_tasks.model_dump()  # FIXED: Use model_dump()
+                    message=f"📥 Pulled {len(data['tasks'])} tasks for {target_date}",
+                    data=data
                 )
             else:
                 # Try local cache as fallback
-                local_data = self._load_local_copy(target_date)
+                local_data = self._load_local_data(target_date)
                 if local_data:
                     return SyncResult(
                         success=True,
-                        message=f"📁 Loaded {len(local_data.tasks)} tasks from local cache (Supabase returned no data)",
-                        data=local_data.model_dump()  # FIXED: Use model_dump()
+                        message=f"📁 Loaded {len(local_data['tasks'])} tasks from local cache (Supabase returned no data)",
+                        data=local_data
                     )
 
                 return SyncResult(
@@ -286,12 +586,12 @@ class ImprovedTaskSync:
 
         except Exception as e:
             # Try local cache as fallback
-            local_data = self._load_local_copy(target_date)
+            local_data = self._load_local_data(target_date)
             if local_data:
                 return SyncResult(
                     success=True,
-                    message=f"📁 Loaded {len(local_data.tasks)} tasks from local cache (Supabase error: {str(e)})",
-                    data=local_data.model_dump()  # FIXED: Use model_dump()
+                    message=f"📁 Loaded {len(local_data['tasks'])} tasks from local cache (Supabase error: {str(e)})",
+                    data=local_data
                 )
 
             return SyncResult(
@@ -302,13 +602,196 @@ class ImprovedTaskSync:
                 suggested_fix="Check connection and try local cache"
             )
 
+    async def _get_async_client(self) -> "AsyncClient":
+        """Return the async Supabase client, creating it on first use"""
+        if self._async_supabase is None:
+            supabase = _lazy_supabase()
+            import httpx
+
+            self._async_supabase = await supabase.acreate_client(
+                self.supabase_url,
+                self.supabase_key,
+                options=supabase.AsyncClientOptions(
+                    postgrest_client_timeout=10,
+                    schema='public',
+                    httpx_client=httpx.AsyncClient(**_httpx_settings())
+                )
+            )
+        return self._async_supabase
+
+    async def pull_tasks_many(self, dates: List[str]) -> Dict[str, SyncResult]:
+        """
+        Pull several dates concurrently from Supabase
+
+        Requests run through the async client, at most PULL_CONCURRENCY at a
+        time. Like pull_tasks, recently pulled dates are served from memory and
+        each date falls back to its local cache on error or missing row.
+        """
+        await self._get_async_client()
+
+        semaphore = asyncio.Semaphore(PULL_CONCURRENCY)
+        results = await asyncio.gather(*[self._pull_one(d, semaphore) for d in dates])
+        return dict(zip(dates, results))
+
+    async def _pull_one(self, target_date: str, semaphore: asyncio.Semaphore) -> SyncResult:
+        """Pull a single date with the async client (see pull_tasks_many)"""
+        # Recently pulled data skips the network round trip
+        cached = self._cache_get(target_date)
+        if cached is not None:
+            return SyncResult(
+                success=True,
+                message=f"⚡ Loaded {len(cached['tasks'])} tasks from memory for {target_date}",
+                data=cached
+            )
+
+        # A malformed row fails this date only, never the whole gather
+        data, error = None, None
+        try:
+            async with semaphore:
+                response = await awith_retry(self._async_supabase.table('daily_tasks')\
+                    .select(DAILY_TASKS_COLUMNS)\
+                    .eq('date', target_date)\
+                    .maybe_single()\
+                    .execute)
+            if response is not None and response.data:
+                daily_tasks = DailyTasks.model_validate(response.data)
+                await asyncio.to_thread(self._save_local_copy, daily_tasks)
+                data = daily_tasks.model_dump()
+        except Exception as e:
+            error = e
+
+        if data is not None:
+            self._cache_put(target_date, data)
+            return SyncResult(
+                success=True,
+                message=f"📥 Pulled {len(data['tasks'])} tasks for {target_date}",
+                data=data
+            )
+
+        # Try local cache as fallback
+        local_data = await asyncio.to_thread(self._load_local_data, target_date)
+        if local_data:
+            reason = f"Supabase error: {error}" if error else "Supabase returned no data"
+            return SyncResult(
+                success=True,
+                message=f"📁 Loaded {len(local_data['tasks'])} tasks from local cache ({reason})",
+                data=local_data
+            )
+
+        if error:
+            return SyncResult(
+                success=False,
+                message=f"❌ Error pulling tasks for {target_date}",
+                error=str(error),
+                error_type="database_error",
+                suggested_fix="Check connection and try local cache"
+            )
+        return SyncResult(
+            success=True,
+            message=f"📭 No tasks found for {target_date}",
+            data=DailyTasks(date=target_date).model_dump()
+        )
+
+    async def backfill(self, start_date: str, end_date: str) -> Dict[str, SyncResult]:
+        """
+        Push every local daily file between two dates (inclusive)
+
+        Files are read on a thread pool while uploads run on the async client,
+        so disk reads and parsing overlap with requests in flight. At most
+        PUSH_CONCURRENCY upserts run at a time.
+        """
+        dates = [d for d in _parse_date_range(f"{start_date}..{end_date}")
+                 if (self.daily_dir / f"{d}.json").exists()]
+        client = await self._get_async_client()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=PUSH_CONCURRENCY * 2)
+        results: Dict[str, SyncResult] = {}
+
+        async def produce():
+            loop = asyncio.get_running_loop()
+            readers = 4
+            with ThreadPoolExecutor(max_workers=readers) as pool:
+                # Keep only `readers` loads in flight: the next file is read once the
+                # oldest load is queued, so a full queue holds back reads as well
+                loads: deque = deque()
+                for target_date in dates:
+                    loads.append((target_date, loop.run_in_executor(pool, self._load_local_data, target_date)))
+                    if len(loads) == readers:
+                        done_date, load = loads.popleft()
+                        await queue.put((done_date, await load))
+                while loads:
+                    done_date, load = loads.popleft()
+                    await queue.put((done_date, await load))
+            for _ in range(PUSH_CONCURRENCY):
+                await queue.put(None)
+
+        async def consume():
+            while (item := await queue.get()) is not None:
+                target_date, data = item
+                if not data:
+                    results[target_date] = SyncResult(
+                        success=False,
+                        message=f"❌ Could not read local file for {target_date}",
+                        error_type="file_error",
+                        suggested_fix=f"Check data/daily/{target_date}.json"
+                    )
+                    continue
+                row = self._remote_row({**data, 'date': target_date})
+                try:
+                    response = await awith_retry(client.table('daily_tasks')\
+                        .upsert(row, on_conflict='date')\
+                        .execute)
+                    self._mem_cache.pop(target_date, None)
+                    if response.data:
+                        results[target_date] = SyncResult(
+                            success=True,
+                            message=f"✅ Upserted {len(row['tasks'])} tasks for {target_date}"
+                        )
+                    else:
+                        results[target_date] = SyncResult(
+                            success=False,
+                            message=f"❌ Failed to sync tasks for {target_date}",
+                            error="No data returned from Supabase",
+                            error_type="database_error",
+                            suggested_fix="Check Supabase table permissions and schema"
+                        )
+                except Exception as e:
+                    results[target_date] = self._error_result(f"❌ Error syncing tasks for {target_date}", e)
+
+        await asyncio.gather(produce(), *[consume() for _ in range(PUSH_CONCURRENCY)])
+        return {d: results[d] for d in dates}
+
+def _raw_shape_problem(data: Any) -> Optional[str]:
+    """Cheap top-level check of an unvalidated daily file; returns the problem or None"""
+    if not isinstance(data, dict):
+        return "Top level must be an object"
+    try:
+        date.fromisoformat(data.get('date'))
+    except (TypeError, ValueError):
+        return "'date' must be a YYYY-MM-DD string"
+    tasks = data.get('tasks')
+    if not isinstance(tasks, list) or not all(isinstance(t, dict) for t in tasks):
+        return "'tasks' must be a list of objects"
+    if not isinstance(data.get('summary', {}), dict):
+        return "'summary' must be an object"
+    return None
+
+def _parse_date_range(spec: str) -> List[str]:
+    """Expand 'YYYY-MM-DD..YYYY-MM-DD' (inclusive) into a list of ISO dates"""
+    start_str, _, end_str = spec.partition('..')
+    start = date.fromisoformat(start_str)
+    end = date.fromisoformat(end_str) if end_str else start
+    return [(start + timedelta(days=i)).isoformat() for i in range((end - start).days + 1)]
+
 def main():
     """Enhanced CLI interface with better error reporting"""
     if len(sys.argv) < 2:
         print("Usage: python sync_improved.py [push|pull|test] [date]")
         print("  push - Push tasks from local file to Supabase")
+        print("         push [date] --validate validates every task before pushing")
         print("  pull - Pull tasks from Supabase to local file")
+        print("         pull --dates 2025-09-01..2025-09-30 pulls a range concurrently")
         print("  test - Test Supabase connection")
+        print("  backfill <start> <end> - Push all local daily files in a date range")
         return
 
     command = sys.argv[1]
@@ -317,10 +800,33 @@ def main():
     try:
         sync = ImprovedTaskSync()
 
+        if command == "pull" and target_date == "--dates":
+            if len(sys.argv) < 4:
+                print("❌ --dates needs a range like 2025-09-01..2025-09-30")
+                return
+            results = asyncio.run(sync.pull_tasks_many(_parse_date_range(sys.argv[3])))
+            for pulled_date, result in results.items():
+                print(f"{pulled_date}: {result.message}")
+            return
+
+        if command == "backfill":
+            if len(sys.argv) < 4:
+                print("❌ Usage: python sync_improved.py backfill <start> <end>")
+                return
+            results = asyncio.run(sync.backfill(sys.argv[2], sys.argv[3]))
+            for pushed_date, result in results.items():
+                print(f"{pushed_date}: {result.message}")
+            print(f"📊 {sum(r.success for r in results.values())}/{len(results)} days pushed")
+            return
+
         if command == "test":
             result = sync.test_connection()
         elif command == "push":
-            result = sync.push_tasks_from_file(target_date)
+            if "--validate" in sys.argv:
+                result = sync.push_tasks_from_file(target_date if target_date != "--validate" else None)
+            else:
+                file_date = target_date or date.today().isoformat()
+                result = sync.push_raw_from_file(sync.daily_dir / f"{file_date}.json")
         elif command == "pull":
             result = sync.pull_tasks(target_date)
         else:
@@ -3,13 +3,6 @@
 Debug Supabase connection issues
 """
 
-import sys
-import os
-from pathlib import Path
-
-# Add backend to path
-sys.path.append(str(Path(__file__).parent / "backend"))
-
 def debug_connection():
     """Debug the Supabase connection step by step"""
     print("Debugging Supabase connection...")
@@ -17,11 +10,8 @@ def debug_connection():
     try:
         # Step 1: Check environment variables
         print("\n1. Checking environment variables...")
-        from dotenv import load_dotenv
-        load_dotenv('backend/.env')
-
-        url = os.getenv('SUPABASE_URL')
-        key = os.getenv('SUPABASE_KEY')
+        from backend._env import _env
+        url, key = _env()
 
         if url and key:
             print(f"[OK] SUPABASE_URL: {url[:30]}...")
@@ -34,8 +24,8 @@ def debug_connection():
 
         # Step 2: Test Supabase client creation
         print("\n2. Creating Supabase client...")
-        from supabase import create_client
-        supabase = create_client(url, key)
+        from backend.sync_improved import get_supabase
+        supabase = get_supabase()
         print("[OK] Supabase client created")
 
         # Step 3: Test basic table access
@@ -68,14 +58,9 @@ def check_schema():
     print("\n5. Checking database schema...")
 
     try:
-        from dotenv import load_dotenv
-        load_dotenv('backend/.env')
-
-        from supabase import create_client
-        url = os.getenv('SUPABASE_URL')
-        key = os.getenv('SUPABASE_KEY')
-
-        supabase = create_client(url, key)
+        # Reuses the client created in debug_connection()
+        from backend.sync_improved import get_supabase
+        supabase = get_supabase()
 
         # Try to describe the table structure
         # Note: This might not work depending on permissions
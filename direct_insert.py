@@ -3,26 +3,18 @@
 Direct insert script to bypass sync issues
 """
 
-import os
 import json
 from pathlib import Path
-from supabase import create_client
-from dotenv import load_dotenv
 
-# Load environment variables from backend/.env
-load_dotenv('backend/.env')
+from backend.sync_improved import get_supabase
 
-# Get Supabase credentials
-supabase_url = os.getenv('SUPABASE_URL')
-supabase_key = os.getenv('SUPABASE_KEY')
-
-if not supabase_url or not supabase_key:
-    print("ERROR: Missing Supabase credentials")
+# Shared Supabase client (loads backend/.env)
+try:
+    supabase = get_supabase()
+except ValueError as e:
+    print(f"ERROR: {e}")
     exit(1)
 
-# Create Supabase client
-supabase = create_client(supabase_url, supabase_key)
-
 # Load the task data
 with open('data/daily/2025-09-29.json', 'r') as f:
     task_data = json.load(f)
@@ -9,18 +9,15 @@ import sys
 import os
 from pathlib import Path
 
-# Add backend to path
-sys.path.append(str(Path(__file__).parent / "backend"))
-
 def test_imports():
     """Test that all modules can be imported"""
     print("Testing module imports...")
 
     try:
-        from models import Task, DailyTasks, Config
+        from backend.models import Task, DailyTasks, Config
         print("[OK] Backend models imported successfully")
 
-        from sync import TaskSync, SyncResult
+        from backend.sync import TaskSync, SyncResult
         print("[OK] Backend sync module imported successfully")
 
         return True
@@ -33,7 +30,7 @@ def test_basic_functionality():
     print("Testing basic functionality...")
 
     try:
-        from models import Task, DailyTasks, Config
+        from backend.models import Task, DailyTasks, Config
 
         # Test task creation
         task = Task(
@@ -12,43 +12,33 @@ This script orchestrates the complete brain dump workflow:
 All issues from the original implementation are addressed here.
 """
 
+import asyncio
+import importlib.util
 import os
+import socket
 import sys
-import json
-import subprocess
 import time
+from collections import Counter
 from datetime import date
 from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
 
-def run_command(command, description, check_output=False):
-    """Run a command with error handling"""
-    print(f"🔄 {description}...")
-    try:
-        if check_output:
-            result = subprocess.run(command, shell=True, capture_output=True, text=True, timeout=30)
-            if result.returncode == 0:
-                print(f"✅ {description} - Success")
-                return result.stdout.strip()
-            else:
-                print(f"❌ {description} - Failed: {result.stderr}")
-                return None
-        else:
-            result = subprocess.run(command, shell=True, timeout=30)
-            if result.returncode == 0:
-                print(f"✅ {description} - Success")
-                return True
-            else:
-                print(f"❌ {description} - Failed (exit code: {result.returncode})")
-                return False
-    except subprocess.TimeoutExpired:
-        print(f"⏱️ {description} - Timeout (30s)")
-        return False
-    except Exception as e:
-        print(f"❌ {description} - Error: {e}")
-        return False
+# Checked with find_spec before anything is imported; the modules themselves
+# are imported by the steps that use them
+REQUIRED_MODULES = ("supabase", "dotenv", "pydantic", "backend.models")
+
+def _port_open(port, timeout=0.2):
+    """Return True if something accepts TCP connections on localhost:port"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        return sock.connect_ex(("127.0.0.1", port)) == 0
+
+async def _probe_frontend_ports(ports):
+    """Probe the frontend ports concurrently, returning (port, is_open) pairs"""
+    results = await asyncio.gather(*(asyncio.to_thread(_port_open, port) for port in ports))
+    return list(zip(ports, results))
 
 def check_prerequisites():
     """Check all prerequisites before processing"""
@@ -56,14 +46,12 @@ def check_prerequisites():
 
     issues = []
 
-    # Check Python dependencies
-    try:
-        import supabase
-        import dotenv
-        from backend.models import DailyTasks
+    # Check Python dependencies without executing them
+    missing = [name for name in REQUIRED_MODULES if importlib.util.find_spec(name) is None]
+    if missing:
+        issues.extend(f"Missing Python dependency: {name}" for name in missing)
+    else:
         print("✅ Python dependencies available")
-    except ImportError as e:
-        issues.append(f"Missing Python dependency: {e}")
 
     # Check environment file
     env_file = Path("backend/.env")
@@ -86,23 +74,24 @@ def check_prerequisites():
 
     # Check frontend status
     frontend_running = False
-    for port in [3000, 3001]:
-        try:
-            import requests
-            response = requests.get(f"http://localhost:{port}", timeout=5)
-            if response.status_code == 200:
-                print(f"✅ Frontend running on port {port}")
-                frontend_running = True
-                break
-        except:
-            continue
+    for port, is_open in asyncio.run(_probe_frontend_ports([3000, 3001])):
+        if is_open:
+            print(f"✅ Frontend running on port {port}")
+            frontend_running = True
+            break
 
     if not frontend_running:
         issues.append("Frontend not running on port 3000 or 3001")
 
-    # Check directories
-    for dir_path in ["data/daily", "data/processed", "data/input"]:
-        Path(dir_path).mkdir(parents=True, exist_ok=True)
+    # Check directories; one scandir of data/ means warm runs make no mkdir calls
+    try:
+        with os.scandir("data") as entries:
+            existing = {entry.name for entry in entries if entry.is_dir()}
+    except FileNotFoundError:
+        existing = set()
+    for name in ["daily", "processed", "input"]:
+        if name not in existing:
+            Path("data", name).mkdir(parents=True, exist_ok=True)
     print("✅ Data directories ready")
 
     if issues:
@@ -114,51 +103,72 @@ def check_prerequisites():
     print("\n✅ All prerequisites satisfied!")
     return True
 
+def _summarize_tasks(tasks):
+    """Build the daily summary dict from raw task dicts in a single pass"""
+    categories = Counter()
+    priorities = Counter()
+    status_counts = Counter()
+    estimated_minutes = actual_minutes = 0
+
+    for task in tasks:
+        categories[task["category"]] += 1
+        priorities[task["priority"]] += 1
+        status_counts[task["status"]] += 1
+        estimated_minutes += task["estimated_minutes"]
+        actual_minutes += task.get("actual_minutes", 0)
+
+    total = len(tasks)
+    completed = status_counts["completed"]
+    return {
+        "total_tasks": total,
+        "completed_tasks": completed,
+        "in_progress_tasks": status_counts["in_progress"],
+        "blocked_tasks": status_counts["blocked"],
+        "total_estimated_minutes": estimated_minutes,
+        "total_actual_minutes": actual_minutes,
+        "completion_percentage": round(completed / total * 100, 1) if total else 0.0,
+        "categories": dict(categories),
+        "priorities": dict(priorities)
+    }
+
 def create_sample_task_for_testing():
     """Create a sample task in the correct format for testing"""
     target_date = date.today().isoformat()
 
+    tasks = [
+        {
+            "id": f"brain-dump-test-{int(time.time())}",
+            "title": "Test Brain Dump Processing Workflow",
+            "description": "Verify that the complete brain dump processing workflow works end-to-end",
+            "priority": "P1",
+            "status": "not_started",
+            "progress": 0,
+            "category": "admin",
+            "estimated_minutes": 30,
+            "actual_minutes": 0,
+            "time_block": "morning",
+            "subtasks": [],
+            "notes": [],
+            "success_criteria": "Task appears in frontend UI with all metadata",
+            "dependencies": [],
+            "tags": ["test", "workflow", "brain-dump"],
+            "created_at": f"{target_date}T08:00:00",
+            "updated_at": f"{target_date}T08:00:00",
+            "completed_at": None
+        }
+    ]
+
     sample_daily_tasks = {
         "date": target_date,
-        "tasks": [
-            {
-                "id": f"brain-dump-test-{int(time.time())}",
-                "title": "Test Brain Dump Processing Workflow",
-                "description": "Verify that the complete brain dump processing workflow works end-to-end",
-                "priority": "P1",
-                "status": "not_started",
-                "progress": 0,
-                "category": "admin",
-                "estimated_minutes": 30,
-                "actual_minutes": 0,
-                "time_block": "morning",
-                "subtasks": [],
-                "notes": [],
-                "success_criteria": "Task appears in frontend UI with all metadata",
-                "dependencies": [],
-                "tags": ["test", "workflow", "brain-dump"],
-                "created_at": f"{target_date}T08:00:00",
-                "updated_at": f"{target_date}T08:00:00",
-                "completed_at": None
-            }
-        ],
-        "summary": {
-            "total_tasks": 1,
-            "completed_tasks": 0,
-            "in_progress_tasks": 0,
-            "blocked_tasks": 0,
-            "total_estimated_minutes": 30,
-            "total_actual_minutes": 0,
-            "completion_percentage": 0.0,
-            "categories": {"admin": 1},
-            "priorities": {"P1": 1}
-        }
+        "tasks": tasks,
+        "summary": _summarize_tasks(tasks)
     }
 
+    from pydantic_core import to_json
+
     # Save to daily file
     daily_file = Path(f"data/daily/{target_date}.json")
-    with open(daily_file, 'w') as f:
-        json.dump(sample_daily_tasks, f, indent=2)
+    daily_file.write_bytes(to_json(sample_daily_tasks, indent=2))
 
     print(f"✅ Sample task created in {daily_file}")
     return target_date
@@ -167,23 +177,16 @@ def validate_task_format(target_date):
     """Validate that the task format matches Pydantic models"""
     print("🔍 Validating task format...")
 
+    from pydantic import ValidationError
+    from backend.models import DailyTasks
+
     try:
-        # Test Pydantic model validation
-        test_command = f"""python -c "
-from backend.models import DailyTasks
-import json
-data = json.load(open('data/daily/{target_date}.json'))
-daily_tasks = DailyTasks(**data)
-print('Model validation passed')
-" """
-
-        result = run_command(test_command, "Validating Pydantic models", check_output=True)
-        if result and "Model validation passed" in result:
-            print("✅ Task format validation successful")
-            return True
-        else:
-            print("❌ Task format validation failed")
-            return False
+        DailyTasks.model_validate_json(Path(f"data/daily/{target_date}.json").read_bytes())
+        print("✅ Task format validation successful")
+        return True
+    except ValidationError as e:
+        print(f"❌ Task format validation failed: {e}")
+        return False
     except Exception as e:
         print(f"❌ Task format validation error: {e}")
         return False
@@ -192,28 +195,35 @@ def sync_to_supabase(target_date):
     """Sync tasks to Supabase using improved sync script"""
     print("🔄 Syncing to Supabase...")
 
+    from backend.sync_improved import ImprovedTaskSync
+
+    # One sync instance (and one pooled Supabase client) serves both steps
+    try:
+        sync = ImprovedTaskSync()
+    except Exception as e:
+        print(f"❌ Could not create Supabase client: {e}")
+        return False
+
     # First test connection
-    test_result = run_command(
-        "python backend/sync_improved.py test",
-        "Testing Supabase connection",
-        check_output=True
-    )
-
-    if not test_result or "successful" not in test_result:
-        print("❌ Supabase connection test failed")
+    print("🔄 Testing Supabase connection...")
+    test_result = sync.test_connection()
+    if not test_result.success:
+        print(f"❌ Supabase connection test failed: {test_result.error}")
         return False
+    print("✅ Testing Supabase connection - Success")
 
     # Push tasks
-    sync_result = run_command(
-        f"python backend/sync_improved.py push {target_date}",
-        f"Pushing tasks for {target_date}",
-        check_output=True
-    )
+    print(f"🔄 Pushing tasks for {target_date}...")
+    sync_result = sync.push_raw_from_file(sync.daily_dir / f"{target_date}.json")
 
-    if sync_result and "Successfully" in sync_result:
+    if sync_result.success:
+        print(f"{sync_result.message}")
         print("✅ Tasks synced to Supabase successfully")
         return True
     else:
+        print(f"{sync_result.message}")
+        if sync_result.suggested_fix:
+            print(f"💡 Suggested Fix: {sync_result.suggested_fix}")
         print("❌ Failed to sync tasks to Supabase")
         return False
 
@@ -6,150 +6,79 @@ This script generates insightful daily, weekly, and monthly reports by analyzing
 task completion data and patterns using Claude Code sub-agents.
 
 Usage:
-    python scripts/generate_report.py [--type daily|weekly|monthly] [--date 2025-01-29]
+    python scripts/generate_report.py [--type daily|weekly|monthly|all] [--date 2025-01-29]
 """
 
+import asyncio
+import hashlib
+import io
 import json
+import os
 import sys
+import tempfile
+from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 
-# Add backend to path for imports
-sys.path.append(str(Path(__file__).parent.parent / "backend"))
+from pydantic_core import to_json
 
-from models import Task, DailyTasks, DaySummary
-from sync import TaskSync, SyncResult
+# Scripts run from scripts/, so put the project root on the path for the backend package
+sys.path.append(str(Path(__file__).parent.parent))
 
+from backend.models import Task, DailyTasks, DaySummary
+from backend.sync import TaskSync, SyncResult
 
-class ReportGenerator:
-    """Generates productivity reports using sub-agents"""
-
-    def __init__(self, data_dir: str = "data"):
-        self.data_dir = Path(data_dir)
-        self.reports_dir = self.data_dir / "reports"
-        self.reports_dir.mkdir(parents=True, exist_ok=True)
-        self.sync = TaskSync(str(self.data_dir))
-
-    def _call_sub_agent(self, agent_name: str, prompt: str, context: Dict[str, Any] = None) -> Dict[str, Any]:
-        """
-        Call a Claude Code sub-agent
-
-        NOTE: This is a placeholder. In actual implementation, you would use
-        Claude Code's Task tool to call the sub-agents.
-        """
-        print(f"🤖 Calling {agent_name} sub-agent...")
-
-        # Mock responses for testing
-        if agent_name == "progress-analyst":
-            return self._mock_progress_analyst_response(context)
-        elif agent_name == "report-composer":
-            return self._mock_report_composer_response(context)
-        else:
-            raise ValueError(f"Unknown sub-agent: {agent_name}")
-
-    def _mock_progress_analyst_response(self, context: Dict) -> Dict[str, Any]:
-        """Mock response from progress-analyst agent"""
-        return {
-            "agent_name": "progress-analyst",
-            "analysis_period": context.get("period", "Today"),
-            "data": {
-                "overall_metrics": {
-                    "total_tasks": 8,
-                    "completed_tasks": 6,
-                    "completion_rate": 75.0,
-                    "avg_daily_tasks": 8.0,
-                    "time_estimation_accuracy": 82.5
-                },
-                "patterns": {
-                    "strongest_performance": {
-                        "metric": "Morning deep work completion",
-                        "score": 90,
-                        "insight": "Development tasks scheduled 9-11 AM had 90% completion rate"
-                    },
-                    "biggest_challenge": {
-                        "metric": "Afternoon context switching",
-                        "score": 60,
-                        "insight": "Mixed task types after 2 PM had lower completion rate"
-                    }
-                },
-                "recommendations": [
-                    {
-                        "type": "scheduling",
-                        "priority": "high",
-                        "action": "Continue batching development work in morning slots",
-                        "rationale": "Morning development completion rate is excellent",
-                        "expected_impact": "Maintain high productivity in complex tasks"
-                    },
-                    {
-                        "type": "workflow",
-                        "priority": "medium",
-                        "action": "Group admin tasks into single afternoon block",
-                        "rationale": "Reduce context switching penalty",
-                        "expected_impact": "10% improvement in afternoon completion"
-                    }
-                ],
-                "trends": [
-                    {
-                        "metric": "P1 completion rate",
-                        "direction": "stable",
-                        "change": "+2% from yesterday",
-                        "context": "Consistent prioritization working well"
-                    }
-                ],
-                "alerts": [
-                    {
-                        "type": "info",
-                        "message": "Time estimates were accurate today",
-                        "suggestion": "Current estimation patterns are working well"
-                    }
-                ]
-            }
-        }
-
-    def _mock_report_composer_response(self, context: Dict) -> Dict[str, Any]:
-        """Mock response from report-composer agent"""
-        report_type = context.get("type", "daily")
-        target_date = context.get("date", date.today().isoformat())
 
-        if report_type == "daily":
-            report_content = f"""# Daily Productivity Report - {target_date}
+# Mock report-composer templates, one string per section so _ReportBuffer can
+# tally each as it is written. Filled in with str.format_map; placeholders are
+# {target_date}, {now}, {month} and {next_report}
+_DAILY_SECTIONS = (
+    """# Daily Productivity Report - {target_date}
 
-## 🎯 Today's Wins
+""",
+    """## 🎯 Today's Wins
 - **6 tasks completed** out of 8 planned (75% completion rate)
 - **Task Management System Setup** - Successfully completed core implementation
 - **Morning Focus Time** - 2 hours of uninterrupted development work
 
-## 📊 Performance Snapshot
+""",
+    """## 📊 Performance Snapshot
 - **Focus time**: 2.5 hours of deep work completed
 - **Energy alignment**: 90% of complex tasks done during peak energy
 - **Estimation accuracy**: 82% average accuracy vs planned time
 
-## 🔍 Key Insight
+""",
+    """## 🔍 Key Insight
 Morning development sessions (9-11 AM) continue to show excellent completion rates. The focused time blocks are working well for complex technical work.
 
-## 🚀 Tomorrow's Setup
+""",
+    """## 🚀 Tomorrow's Setup
 - **Priority focus**: Complete frontend implementation and deploy
 - **Energy plan**: Schedule remaining development work for morning peak energy
 - **Quick prep**: Review frontend requirements before starting tomorrow
 
 ---
-*Generated at 6:00 PM | Next report: Tomorrow at 6 PM*"""
+*Generated at 6:00 PM | Next report: Tomorrow at 6 PM*""",
+)
 
-        elif report_type == "weekly":
-            report_content = f"""# Weekly Productivity Report - Week of {target_date}
+_WEEKLY_SECTIONS = (
+    """# Weekly Productivity Report - Week of {target_date}
 
-## 📈 Week at a Glance
+""",
+    """## 📈 Week at a Glance
 - **35 tasks completed** out of 42 planned (83% completion rate)
 - **18 hours** of productive work logged
 - **Task Management System** - Major milestone achieved with core system complete
 
-## 🎯 Objective Progress
+""",
+    """## 🎯 Objective Progress
 - **Build Task Management System**: 80% complete - Core system working, frontend in progress
 - **Improve Daily Productivity**: 85% complete - Excellent morning focus patterns established
 - **Learn AI Workflows**: 70% complete - Sub-agent system successfully implemented
 
-## 📊 Performance Patterns
+""",
+    """## 📊 Performance Patterns
 ### ✅ What Worked Well
 - **Morning development blocks**: 90% completion rate for complex tasks
 - **Priority alignment**: P1 tasks consistently completed first
@@ -158,7 +87,8 @@ Morning development sessions (9-11 AM) continue to show excellent completion rat
 - **Afternoon energy management**: 65% completion rate, room for optimization
 - **Task estimation**: Slightly over-estimating admin tasks
 
-## 🔍 Deep Insights
+""",
+    """## 🔍 Deep Insights
 ### Time Management
 - **Peak productivity**: 9-11 AM shows highest completion rates
 - **Energy alignment**: Complex tasks well-matched to morning energy
@@ -169,7 +99,8 @@ Morning development sessions (9-11 AM) continue to show excellent completion rat
 - **Estimation accuracy**: 82% overall, improving each day
 - **Priority effectiveness**: P1 completion at 95%
 
-## 🚀 Next Week's Focus
+""",
+    """## 🚀 Next Week's Focus
 ### Process Improvements
 1. **Batch afternoon admin**: Group similar tasks to reduce context switching
 2. **Protect morning focus**: Continue reserving 9-11 AM for complex work
@@ -180,15 +111,18 @@ Morning development sessions (9-11 AM) continue to show excellent completion rat
 - **Task batching**: Group by category and energy requirement
 
 ---
-*Report generated: {datetime.now().strftime('%Y-%m-%d %H:%M')} | Covers: Week of {target_date}*"""
+*Report generated: {now} | Covers: Week of {target_date}*""",
+)
 
-        else:  # monthly
-            report_content = f"""# Monthly Productivity Report - {datetime.now().strftime('%B %Y')}
+_MONTHLY_SECTIONS = (
+    """# Monthly Productivity Report - {month}
 
-## 🎯 Executive Summary
+""",
+    """## 🎯 Executive Summary
 Excellent month with successful implementation of the task management system and establishment of highly effective morning focus routines. Completion rates consistently above 80% with strong alignment to strategic objectives.
 
-## 📊 Monthly Metrics
+""",
+    """## 📊 Monthly Metrics
 | Metric | This Month | Last Month | Change |
 |--------|------------|------------|---------|
 | Completion Rate | 81% | 72% | +9% |
@@ -196,17 +130,20 @@ Excellent month with successful implementation of the task management system and
 | Deep Work Hours | 72 | 58 | +14 |
 | Objective Progress | 78% | 45% | +33% |
 
-## 🏆 Major Achievements
+""",
+    """## 🏆 Major Achievements
 1. **Task Management System**: Successfully built and deployed complete productivity system
 2. **Morning Routine Optimization**: Established consistent 9-11 AM focus blocks with 90% completion
 3. **Sub-Agent Integration**: Implemented AI-powered task processing and prioritization
 
-## 🎯 Objective Progress Review
+""",
+    """## 🎯 Objective Progress Review
 - **Build Task Management System**: 95% complete - System operational and improving productivity
 - **Improve Daily Productivity**: 85% complete - Strong patterns established, refinements ongoing
 - **Learn AI Workflows**: 80% complete - Successfully integrated sub-agents into daily workflow
 
-## 📈 Productivity Evolution
+""",
+    """## 📈 Productivity Evolution
 ### System Improvements
 - **Sub-agent workflow**: Reduced morning planning time by 70%
 - **Energy alignment**: Improved complex task completion by 25%
@@ -216,7 +153,8 @@ Excellent month with successful implementation of the task management system and
 - **Biggest growth area**: Afternoon task batching (improved from 60% to 75%)
 - **Persistent challenge**: Personal task completion (65% vs 85% for work tasks)
 
-## 🔍 Strategic Insights
+""",
+    """## 🔍 Strategic Insights
 ### Time Management Mastery
 Month showed significant improvement in matching task complexity to energy levels, with morning focus blocks becoming highly productive and consistent.
 
@@ -226,7 +164,8 @@ Successfully identified and leveraged peak energy periods, resulting in dramatic
 ### Task Execution Excellence
 Established reliable patterns for task breakdown, estimation, and scheduling that consistently deliver results.
 
-## 🚀 Next Month's Strategic Focus
+""",
+    """## 🚀 Next Month's Strategic Focus
 ### Priority Objectives
 1. **Refine Personal Task Management**: Improve completion rate for personal tasks to match work performance
 2. **Advanced Sub-Agent Features**: Add coaching agent for stuck tasks and enhanced reporting
@@ -237,53 +176,302 @@ Established reliable patterns for task breakdown, estimation, and scheduling tha
 - **Habit formation**: Solidify evening review and morning planning routines
 
 ---
-*Comprehensive analysis complete | Next monthly report: {(datetime.now() + timedelta(days=30)).strftime('%Y-%m-%d')}*"""
+*Comprehensive analysis complete | Next monthly report: {next_report}*""",
+)
+
+_REPORT_SECTIONS = {
+    "daily": _DAILY_SECTIONS,
+    "weekly": _WEEKLY_SECTIONS,
+    "monthly": _MONTHLY_SECTIONS,
+}
+
+
+class _ReportBuffer:
+    """Accumulates report markdown, tallying words and headings as chunks are written"""
+
+    def __init__(self):
+        self._buf = io.StringIO()
+        self.word_count = 0
+        self.sections = 0
+
+    def write(self, chunk: str) -> None:
+        self._buf.write(chunk)
+        # Counted per section chunk, so each scan covers a few hundred bytes at most.
+        # split() is kept over a bytes count of b' ': the templates separate many
+        # words with newlines only, which a space count would miss
+        self.word_count += len(chunk.split())
+        self.sections += chunk.count("##")
+
+    def getvalue(self) -> str:
+        return self._buf.getvalue()
+
+
+# Days fetched per pull query; a monthly window becomes a few concurrent batches
+PULL_BATCH_DAYS = 7
+
+# Agent responses kept by ReportGenerator for reuse across reports in one process
+AGENT_CACHE_SIZE = 32
+
+
+@dataclass(slots=True)
+class _RunningMetrics:
+    """
+    Progress metrics folded one day at a time
+
+    Days can be added in any order (e.g. as concurrent pulls complete), and
+    finalize() only divides, so no second pass over the tasks is needed.
+    """
+    days: int = 0
+    total_tasks: int = 0
+    completed_tasks: int = 0
+    accuracy_sum: float = 0.0
+    accuracy_count: int = 0
+
+    def add_day(self, day: Dict[str, Any]) -> None:
+        self.days += 1
+        for task in day.get("tasks", ()):
+            self.total_tasks += 1
+            if task["status"] == "completed":
+                self.completed_tasks += 1
+                actual = task.get("actual_minutes") or 0
+                if actual:
+                    estimated = max(task["estimated_minutes"], 1)
+                    self.accuracy_sum += max(0.0, 1 - abs(actual - estimated) / estimated)
+                    self.accuracy_count += 1
+
+    def finalize(self) -> Dict[str, Any]:
+        return {
+            "total_tasks": self.total_tasks,
+            "completed_tasks": self.completed_tasks,
+            "completion_rate": round(self.completed_tasks / self.total_tasks * 100, 1) if self.total_tasks else 0.0,
+            "avg_daily_tasks": round(self.total_tasks / self.days, 1) if self.days else 0.0,
+            "time_estimation_accuracy": round(self.accuracy_sum / self.accuracy_count * 100, 1) if self.accuracy_count else 0.0
+        }
+
+
+class ReportGenerator:
+    """Generates productivity reports using sub-agents"""
+
+    def __init__(self, data_dir: str = "data"):
+        self.data_dir = Path(data_dir)
+        self.reports_dir = self.data_dir / "reports"
+        self.reports_dir.mkdir(parents=True, exist_ok=True)
+        self.sync = TaskSync(str(self.data_dir))
+
+        # (agent, prompt, context digest) -> response, so repeat runs skip the agent;
+        # the digest covers metrics and task data, so changed tasks miss the cache
+        self._agent_cache: Dict[Tuple, Dict[str, Any]] = {}
+
+    async def _call_sub_agent(self, agent_name: str, prompt: str, context: Dict[str, Any] = None) -> Dict[str, Any]:
+        """
+        Call a Claude Code sub-agent
+
+        NOTE: This is a placeholder. In actual implementation, you would use
+        Claude Code's Task tool to call the sub-agents.
+        """
+        context = context or {}
+        digest = hashlib.blake2b(to_json(context, fallback=str), digest_size=16).digest()
+        key = (agent_name, prompt, digest)
+        cached = self._agent_cache.get(key)
+        if cached is not None:
+            print(f"♻️ Reusing {agent_name} response for {context.get('date')}")
+            return cached
+
+        print(f"🤖 Calling {agent_name} sub-agent...")
+
+        # Mock responses for testing; they only build dicts, so no worker thread is needed
+        if agent_name == "progress-analyst":
+            response = self._mock_progress_analyst_response(context)
+        elif agent_name == "report-composer":
+            response = self._mock_report_composer_response(context)
+        else:
+            raise ValueError(f"Unknown sub-agent: {agent_name}")
+
+        if len(self._agent_cache) >= AGENT_CACHE_SIZE:
+            # Oldest entry first; dicts keep insertion order
+            del self._agent_cache[next(iter(self._agent_cache))]
+        self._agent_cache[key] = response
+        return response
+
+    def _mock_progress_analyst_response(self, context: Dict) -> Dict[str, Any]:
+        """Mock response from progress-analyst agent"""
+        return {
+            "agent_name": "progress-analyst",
+            "analysis_period": context.get("period", "Today"),
+            "data": {
+                "overall_metrics": context.get("metrics") or {
+                    "total_tasks": 8,
+                    "completed_tasks": 6,
+                    "completion_rate": 75.0,
+                    "avg_daily_tasks": 8.0,
+                    "time_estimation_accuracy": 82.5
+                },
+                "patterns": {
+                    "strongest_performance": {
+                        "metric": "Morning deep work completion",
+                        "score": 90,
+                        "insight": "Development tasks scheduled 9-11 AM had 90% completion rate"
+                    },
+                    "biggest_challenge": {
+                        "metric": "Afternoon context switching",
+                        "score": 60,
+                        "insight": "Mixed task types after 2 PM had lower completion rate"
+                    }
+                },
+                "recommendations": [
+                    {
+                        "type": "scheduling",
+                        "priority": "high",
+                        "action": "Continue batching development work in morning slots",
+                        "rationale": "Morning development completion rate is excellent",
+                        "expected_impact": "Maintain high productivity in complex tasks"
+                    },
+                    {
+                        "type": "workflow",
+                        "priority": "medium",
+                        "action": "Group admin tasks into single afternoon block",
+                        "rationale": "Reduce context switching penalty",
+                        "expected_impact": "10% improvement in afternoon completion"
+                    }
+                ],
+                "trends": [
+                    {
+                        "metric": "P1 completion rate",
+                        "direction": "stable",
+                        "change": "+2% from yesterday",
+                        "context": "Consistent prioritization working well"
+                    }
+                ],
+                "alerts": [
+                    {
+                        "type": "info",
+                        "message": "Time estimates were accurate today",
+                        "suggestion": "Current estimation patterns are working well"
+                    }
+                ]
+            }
+        }
+
+    def _mock_report_composer_response(self, context: Dict) -> Dict[str, Any]:
+        """Mock response from report-composer agent"""
+        report_type = context.get("type", "daily")
+        target_date = context.get("date", date.today().isoformat())
+        report = _ReportBuffer()
+
+        now = datetime.now()
+        values = {
+            "target_date": target_date,
+            "now": now.strftime('%Y-%m-%d %H:%M'),
+            "month": now.strftime('%B %Y'),
+            "next_report": (now + timedelta(days=30)).strftime('%Y-%m-%d'),
+        }
+        for section in _REPORT_SECTIONS.get(report_type, _MONTHLY_SECTIONS):
+            report.write(section.format_map(values))
 
         return {
             "agent_name": "report-composer",
             "report_type": report_type,
             "data": {
-                "content": report_content,
+                "content": report.getvalue(),
                 "metadata": {
                     "generated_at": datetime.now().isoformat(),
                     "report_date": target_date,
-                    "word_count": len(report_content.split()),
-                    "sections": report_content.count("##")
+                    "word_count": report.word_count,
+                    "sections": report.sections
                 }
             }
         }
 
+    @staticmethod
+    def _write_report_sync(report_file: Path, content: str) -> None:
+        """Write a report atomically, skipping the write if the file already matches"""
+        data = content.encode('utf-8')
+        try:
+            if report_file.stat().st_size == len(data) and report_file.read_bytes() == data:
+                return
+        except FileNotFoundError:
+            pass
+
+        # Unique temp file, so concurrent runs for the same report never share one
+        fd, tmp_path = tempfile.mkstemp(dir=report_file.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, report_file)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    async def _write_report(self, report_file: Path, content: str) -> None:
+        """Write a report from a worker thread so concurrent reports overlap their I/O"""
+        await asyncio.to_thread(self._write_report_sync, report_file, content)
+
+    def _run(self, coro):
+        """Run a coroutine to completion, then release the loop-bound async client"""
+        async def runner():
+            try:
+                return await coro
+            finally:
+                await self.sync.aclose()
+
+        return asyncio.run(runner())
+
     def _get_task_data(self, target_date: str, days_back: int = 1) -> List[Dict]:
         """Get task data for analysis"""
-        task_data = []
-        current_date = datetime.fromisoformat(target_date).date()
+        return self._run(self._get_task_data_async(target_date, days_back))
 
-        for i in range(days_back):
-            check_date = (current_date - timedelta(days=i)).isoformat()
-            result = self.sync.pull_tasks(check_date, use_cache=True)
-
-            if result.success and result.data:
-                task_data.append(result.data)
+    async def _get_task_data_async(self, target_date: str, days_back: int = 1,
+                                   metrics: Optional[_RunningMetrics] = None) -> List[Dict]:
+        """
+        Pull every day in the window
 
-        return task_data
+        The window is split into batches of PULL_BATCH_DAYS, each fetched with
+        one query and all in flight at once. If `metrics` is given, each day is
+        folded into it as soon as its batch arrives, overlapping aggregation
+        with the pulls still outstanding.
+        """
+        current_date = date.fromisoformat(target_date)
+        dates = [(current_date - timedelta(days=i)).isoformat() for i in range(days_back)]
+
+        batches = [
+            self.sync.apull_tasks_batch(dates[i:i + PULL_BATCH_DAYS], use_cache=True)
+            for i in range(0, len(dates), PULL_BATCH_DAYS)
+        ]
+        by_date: Dict[str, Dict] = {}
+        for batch in asyncio.as_completed(batches):
+            for day, result in (await batch).items():
+                if result.success and result.data:
+                    by_date[day] = result.data
+                    if metrics is not None:
+                        metrics.add_day(result.data)
+
+        # Newest first, as the analyst expects
+        return [by_date[day] for day in dates if day in by_date]
 
     def generate_daily_report(self, target_date: str = None) -> str:
         """Generate daily productivity report"""
+        return self._run(self.generate_daily_report_async(target_date))
+
+    async def generate_daily_report_async(self, target_date: str = None) -> str:
+        """Generate daily productivity report (coroutine)"""
         if not target_date:
             target_date = date.today().isoformat()
 
         print(f"📊 Generating daily report for {target_date}")
 
         # Get task data
-        task_data = self._get_task_data(target_date, days_back=1)
+        metrics = _RunningMetrics()
+        task_data = await self._get_task_data_async(target_date, days_back=1, metrics=metrics)
 
         # Analyze with progress-analyst
         analyst_context = {
             "period": "Today",
+            "date": target_date,
             "task_data": task_data,
+            "metrics": metrics.finalize(),
             "type": "daily"
         }
-        analysis = self._call_sub_agent("progress-analyst", "analyze_daily_progress", analyst_context)
+        analysis = await self._call_sub_agent("progress-analyst", "analyze_daily_progress", analyst_context)
 
         # Generate report with report-composer
         composer_context = {
@@ -292,33 +480,39 @@ Established reliable patterns for task breakdown, estimation, and scheduling tha
             "analysis": analysis["data"],
             "task_data": task_data
         }
-        report = self._call_sub_agent("report-composer", "compose_daily_report", composer_context)
+        report = await self._call_sub_agent("report-composer", "compose_daily_report", composer_context)
 
         # Save report
         report_file = self.reports_dir / f"daily_report_{target_date}.md"
-        with open(report_file, 'w', encoding='utf-8') as f:
-            f.write(report["data"]["content"])
+        await self._write_report(report_file, report["data"]["content"])
 
         print(f"✅ Daily report saved to {report_file}")
         return str(report_file)
 
     def generate_weekly_report(self, target_date: str = None) -> str:
         """Generate weekly productivity report"""
+        return self._run(self.generate_weekly_report_async(target_date))
+
+    async def generate_weekly_report_async(self, target_date: str = None) -> str:
+        """Generate weekly productivity report (coroutine)"""
         if not target_date:
             target_date = date.today().isoformat()
 
         print(f"📊 Generating weekly report for week ending {target_date}")
 
         # Get task data for the week
-        task_data = self._get_task_data(target_date, days_back=7)
+        metrics = _RunningMetrics()
+        task_data = await self._get_task_data_async(target_date, days_back=7, metrics=metrics)
 
         # Analyze with progress-analyst
         analyst_context = {
             "period": "Last 7 days",
+            "date": target_date,
             "task_data": task_data,
+            "metrics": metrics.finalize(),
             "type": "weekly"
         }
-        analysis = self._call_sub_agent("progress-analyst", "analyze_weekly_progress", analyst_context)
+        analysis = await self._call_sub_agent("progress-analyst", "analyze_weekly_progress", analyst_context)
 
         # Generate report with report-composer
         composer_context = {
@@ -327,33 +521,39 @@ Established reliable patterns for task breakdown, estimation, and scheduling tha
             "analysis": analysis["data"],
             "task_data": task_data
         }
-        report = self._call_sub_agent("report-composer", "compose_weekly_report", composer_context)
+        report = await self._call_sub_agent("report-composer", "compose_weekly_report", composer_context)
 
         # Save report
         report_file = self.reports_dir / f"weekly_report_{target_date}.md"
-        with open(report_file, 'w', encoding='utf-8') as f:
-            f.write(report["data"]["content"])
+        await self._write_report(report_file, report["data"]["content"])
 
         print(f"✅ Weekly report saved to {report_file}")
         return str(report_file)
 
     def generate_monthly_report(self, target_date: str = None) -> str:
         """Generate monthly productivity report"""
+        return self._run(self.generate_monthly_report_async(target_date))
+
+    async def generate_monthly_report_async(self, target_date: str = None) -> str:
+        """Generate monthly productivity report (coroutine)"""
         if not target_date:
             target_date = date.today().isoformat()
 
         print(f"📊 Generating monthly report for month ending {target_date}")
 
         # Get task data for the month
-        task_data = self._get_task_data(target_date, days_back=30)
+        metrics = _RunningMetrics()
+        task_data = await self._get_task_data_async(target_date, days_back=30, metrics=metrics)
 
         # Analyze with progress-analyst
         analyst_context = {
             "period": "Last 30 days",
+            "date": target_date,
             "task_data": task_data,
+            "metrics": metrics.finalize(),
             "type": "monthly"
         }
-        analysis = self._call_sub_agent("progress-analyst", "analyze_monthly_progress", analyst_context)
+        analysis = await self._call_sub_agent("progress-analyst", "analyze_monthly_progress", analyst_context)
 
         # Generate report with report-composer
         composer_context = {
@@ -362,24 +562,37 @@ Established reliable patterns for task breakdown, estimation, and scheduling tha
             "analysis": analysis["data"],
             "task_data": task_data
         }
-        report = self._call_sub_agent("report-composer", "compose_monthly_report", composer_context)
+        report = await self._call_sub_agent("report-composer", "compose_monthly_report", composer_context)
 
         # Save report
-        month_year = datetime.fromisoformat(target_date).strftime("%Y-%m")
+        month_year = date.fromisoformat(target_date).strftime("%Y-%m")
         report_file = self.reports_dir / f"monthly_report_{month_year}.md"
-        with open(report_file, 'w', encoding='utf-8') as f:
-            f.write(report["data"]["content"])
+        await self._write_report(report_file, report["data"]["content"])
 
         print(f"✅ Monthly report saved to {report_file}")
         return str(report_file)
 
+    def generate_all_reports(self, target_date: str = None) -> List[str]:
+        """Generate daily, weekly and monthly reports concurrently"""
+        if not target_date:
+            target_date = date.today().isoformat()
+
+        async def generate_all():
+            return list(await asyncio.gather(
+                self.generate_daily_report_async(target_date),
+                self.generate_weekly_report_async(target_date),
+                self.generate_monthly_report_async(target_date),
+            ))
+
+        return self._run(generate_all())
+
 
 def main():
     """Command-line interface"""
     import argparse
 
     parser = argparse.ArgumentParser(description='Generate productivity reports')
-    parser.add_argument('--type', '-t', choices=['daily', 'weekly', 'monthly'],
+    parser.add_argument('--type', '-t', choices=['daily', 'weekly', 'monthly', 'all'],
                        default='daily', help='Type of report to generate')
     parser.add_argument('--date', '-d', type=str,
                        help='Target date (YYYY-MM-DD, default: today)')
@@ -396,6 +609,10 @@ def main():
             report_file = generator.generate_weekly_report(target_date)
         elif args.type == 'monthly':
             report_file = generator.generate_monthly_report(target_date)
+        elif args.type == 'all':
+            report_files = generator.generate_all_reports(target_date)
+            print(f"\n🎉 All reports generated: {', '.join(report_files)}")
+            return
 
         print(f"\n🎉 {args.type.title()} report generated: {report_file}")
 
@@ -18,18 +18,147 @@ Usage:
     python scripts/process_morning.py [--input brain_dump.txt] [--date 2025-01-29]
 """
 
-import json
+import asyncio
+import logging
 import os
 import sys
+import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import date, datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, ClassVar, Dict, List, Optional, Set, Tuple, Union
+
+from pydantic_core import from_json, to_json
+
+# Scripts run from scripts/, so put the project root on the path for the backend package
+sys.path.append(str(Path(__file__).parent.parent))
+
+# The backend (pydantic models, supabase client) is imported where it's first
+# used, so `--help` and argument errors don't pay for it
+if TYPE_CHECKING:
+    from pydantic import TypeAdapter
+    from backend.models import Task, Config
+    from backend.sync import SyncResult
+
+logger = logging.getLogger(__name__)
+
+# Max sub-agent calls in flight at once when a stage fans out per task
+AGENT_CONCURRENCY = 5
+
+# Used when config.json has no sub_agent_settings.priority_strategist weights
+DEFAULT_SCORE_WEIGHTS = {"alignment_weight": 0.7, "urgency_weight": 0.3, "impact_weight": 0.0}
+
+
+@dataclass(slots=True)
+class TaskBatch:
+    """
+    The task fields later stages work from, one list per field
+
+    Passed between agent stages instead of full task dicts; to_records() turns it
+    back into dicts at the point a real agent call serializes its prompt.
+    """
+    ids: List[str]
+    titles: List[str]
+    descriptions: List[str]
+    priorities: List[str]
+    estimates: List[int]
+    # priority-strategist's keep/defer verdict; None for records that never carried one
+    actions: List[Optional[str]]
 
-# Add backend to path for imports
-sys.path.append(str(Path(__file__).parent.parent / "backend"))
+    @classmethod
+    def from_records(cls, records: List[Dict[str, Any]]) -> "TaskBatch":
+        return cls(
+            ids=[record.get("id", "") for record in records],
+            titles=[record.get("title", "") for record in records],
+            descriptions=[record.get("description", "") for record in records],
+            priorities=[record.get("priority", "") for record in records],
+            estimates=[record.get("estimated_minutes", 0) for record in records],
+            actions=[record.get("action") for record in records],
+        )
 
-from models import Task, DailyTasks, Config, Objective
-from sync import TaskSync, SyncResult
+    def to_records(self) -> List[Dict[str, Any]]:
+        records = []
+        for task_id, title, description, priority, estimate, action in zip(
+                self.ids, self.titles, self.descriptions, self.priorities, self.estimates, self.actions):
+            record = {"id": task_id, "title": title, "description": description,
+                      "priority": priority, "estimated_minutes": estimate}
+            if action is not None:
+                record["action"] = action
+            records.append(record)
+        return records
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+# Agent prompts: brain dump text, or task lists passed through as Python objects
+# and only serialized by the transport of a real agent call
+Prompt = Union[str, bytes, List[Dict[str, Any]], TaskBatch]
+
+
+@lru_cache(maxsize=8)
+def _load_config_file(path: str, mtime_ns: int) -> Tuple["Config", Dict[str, Any]]:
+    """
+    Parse a config file and serialize it once per (path, mtime)
+
+    Editing the file changes its mtime, so the next load misses the cache.
+    """
+    from backend.models import Config
+
+    # Read, parse and validate in one pass inside pydantic-core
+    config = Config.model_validate_json(Path(path).read_bytes())
+    return config, config.model_dump()
+
+
+def _score_priorities(entries: List[Dict[str, Any]], settings: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Rank priority-strategist entries by a weighted score, highest first
+
+    Each entry is copied with a `priority_score` of alignment, urgency and
+    impact (0-100 each) weighted by `settings`; missing scores count as 0.
+    """
+    weights = {**DEFAULT_SCORE_WEIGHTS, **settings}
+    w_alignment = float(weights["alignment_weight"])
+    w_urgency = float(weights["urgency_weight"])
+    w_impact = float(weights["impact_weight"])
+
+    scored = [
+        {**entry, "priority_score": round(w_alignment * entry.get("alignment_score", 0)
+                                          + w_urgency * entry.get("urgency_score", 0)
+                                          + w_impact * entry.get("impact_score", 0), 2)}
+        for entry in entries
+    ]
+    scored.sort(key=lambda entry: entry["priority_score"], reverse=True)
+    return scored
+
+
+def _by_priority_score(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Order task-architect results by the priority_score of their task, highest first (stable)"""
+    return sorted(results, key=lambda result: result.get("priority_score", 0), reverse=True)
+
+
+class _StdoutHandler(logging.StreamHandler):
+    """
+    Log handler that leaves flushing to stdout's own buffering
+
+    StreamHandler flushes after every record; stdout is already line-buffered
+    on a terminal, and when piped (cron, a wrapper script) block buffering lets
+    a run's status lines go out in a few writes instead of one per line.
+    """
+
+    def flush(self) -> None:
+        pass
+
+
+@lru_cache(maxsize=1)
+def _task_list_adapter() -> "TypeAdapter[List[Task]]":
+    """Validator for a whole list of Tasks, built on first use like the backend import"""
+    from pydantic import TypeAdapter
+    from backend.models import Task
+
+    return TypeAdapter(List[Task])
 
 
 class SubAgentError(Exception):
@@ -37,9 +166,90 @@ class SubAgentError(Exception):
     pass
 
 
+@dataclass(slots=True)
+class SubtaskNode:
+    """A unit of pipeline work and its control block: dependencies, state and result"""
+    id: str
+    deps: Tuple[str, ...]
+    fn: Callable[[Dict[str, Any]], Awaitable[Any]]
+    state: str = "pending"  # pending -> running -> done
+    result: Any = None
+
+
+class Scheduler:
+    """
+    Runs SubtaskNodes as soon as all of their dependencies are done
+
+    Nodes may add further nodes while running (e.g. one per extracted task).
+    Each node's fn receives {dep_id: result} for its dependencies.
+    """
+
+    def __init__(self, verbose: bool = True):
+        self.nodes: Dict[str, SubtaskNode] = {}
+        self.pending: Set[str] = set()
+        self.ready: Set[str] = set()
+        self.done: Set[str] = set()
+        self.verbose = verbose
+
+    def add_node(self, node_id: str, deps: List[str],
+                 fn: Callable[[Dict[str, Any]], Awaitable[Any]]) -> SubtaskNode:
+        if node_id in self.nodes:
+            raise ValueError(f"Duplicate pipeline node: {node_id}")
+        node = SubtaskNode(node_id, tuple(deps), fn)
+        self.nodes[node_id] = node
+        self.pending.add(node_id)
+        return node
+
+    def tcb_list(self) -> str:
+        """One-line view of every node's state"""
+        return " | ".join(f"{node.id}:{node.state}" for node in self.nodes.values())
+
+    async def run(self) -> Dict[str, Any]:
+        """Run every node; returns {node_id: result}. The first failure cancels the rest and is raised."""
+        running: Dict[asyncio.Task, SubtaskNode] = {}
+        try:
+            while self.pending or running:
+                self.ready = {node_id for node_id in self.pending
+                              if all(dep in self.done for dep in self.nodes[node_id].deps)}
+                for node_id in self.ready:
+                    node = self.nodes[node_id]
+                    node.state = "running"
+                    self.pending.discard(node_id)
+                    deps = {dep: self.nodes[dep].result for dep in node.deps}
+                    running[asyncio.create_task(node.fn(deps))] = node
+
+                if not running:
+                    raise SubAgentError(f"Pipeline nodes can never run (missing dependencies): {sorted(self.pending)}")
+
+                if self.verbose and logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"🧵 {self.tcb_list()}")
+
+                finished, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in finished:
+                    node = running.pop(task)
+                    node.result = task.result()
+                    node.state = "done"
+                    self.done.add(node.id)
+        finally:
+            for task in running:
+                task.cancel()
+            # Let cancelled nodes unwind before returning, so none outlives the run
+            await asyncio.gather(*running, return_exceptions=True)
+
+        return {node_id: node.result for node_id, node in self.nodes.items()}
+
+
 class MorningProcessor:
     """Orchestrates the morning brain dump processing workflow"""
 
+    # Sub-agent name -> handler method; every handler takes (prompt, context)
+    _AGENT_DISPATCH: ClassVar[Dict[str, str]] = {
+        "task-extractor": "_mock_task_extractor_response",
+        "priority-strategist": "_mock_priority_strategist_response",
+        "task-architect": "_mock_task_architect_response",
+        "day-optimizer": "_mock_day_optimizer_response",
+    }
+
     def __init__(self, data_dir: str = "data", config_file: str = "backend/config.json"):
         self.data_dir = Path(data_dir)
         self.config_file = Path(config_file)
@@ -51,34 +261,60 @@ class MorningProcessor:
         self.processed_dir.mkdir(parents=True, exist_ok=True)
 
         # Load configuration
-        self.config = self._load_config()
+        # The dict form is serialized once and reused by every agent context
+        self.config, self._config_dict = self._load_config()
+        from backend.sync import TaskSync
         self.sync = TaskSync(str(self.data_dir))
 
-    def _load_config(self) -> Config:
-        """Load user configuration and objectives"""
-        try:
-            if not self.config_file.exists():
-                print(f"⚠️  Config file not found: {self.config_file}")
-                return Config()  # Use defaults
+        # Bounds concurrent sub-agent calls; created per run inside its event loop
+        self._agent_semaphore: Optional[asyncio.Semaphore] = None
+
+        # Supabase push started by process_brain_dump; see join()
+        self._pending_sync: Optional[Future] = None
 
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
+    def _load_config(self) -> Tuple["Config", Dict[str, Any]]:
+        """Load user configuration and objectives, plus their dict form for agent contexts"""
+        from backend.models import Config
 
-            return Config(**config_data)
+        try:
+            try:
+                mtime_ns = self.config_file.stat().st_mtime_ns
+            except FileNotFoundError:
+                logger.warning(f"⚠️  Config file not found: {self.config_file}")
+                config = Config()  # Use defaults
+                return config, config.model_dump()
+
+            return _load_config_file(str(self.config_file), mtime_ns)
         except Exception as e:
-            print(f"⚠️  Error loading config: {e}")
-            return Config()  # Use defaults
+            logger.warning(f"⚠️  Error loading config: {e}")
+            config = Config()  # Use defaults
+            return config, config.model_dump()
 
     def _read_brain_dump(self, input_file: str) -> str:
         """Read brain dump text from input file"""
         input_path = self.input_dir / input_file
 
-        if not input_path.exists():
+        # One stat answers both "missing" and "empty" before the file is opened
+        try:
+            size = input_path.stat().st_size
+        except FileNotFoundError:
             raise FileNotFoundError(f"Brain dump file not found: {input_path}")
+        if size == 0:
+            raise ValueError(f"Brain dump file is empty: {input_path}")
 
         try:
-            with open(input_path, 'r', encoding='utf-8') as f:
-                content = f.read().strip()
+            # Read straight into a buffer of the stat'd size
+            raw = bytearray(size)
+            with open(input_path, 'rb', buffering=0) as f:
+                del raw[f.readinto(raw):]
+
+            # Trim on the raw bytes and decode once; the final str.strip() only
+            # catches non-ASCII whitespace and returns the same object otherwise
+            raw = raw.strip()
+            if b'\r' in raw:
+                # Match text-mode reads, which translate Windows/old-Mac line endings
+                raw = raw.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+            content = raw.decode('utf-8').strip()
 
             if not content:
                 raise ValueError("Brain dump file is empty")
@@ -87,242 +323,396 @@ class MorningProcessor:
         except Exception as e:
             raise ValueError(f"Error reading brain dump: {e}")
 
-    def _call_sub_agent(self, agent_name: str, prompt: str, context: Dict[str, Any] = None) -> Dict[str, Any]:
+    async def _call_sub_agent(self, agent_name: str, prompt: Prompt, context: Dict[str, Any] = None) -> Dict[str, Any]:
         """
         Call a Claude Code sub-agent
 
         NOTE: This is a placeholder. In actual implementation, you would use
         Claude Code's Task tool to call the sub-agents.
 
-        For now, this returns mock data for testing purposes.
+        For now, this returns mock data for testing purposes. At most
+        AGENT_CONCURRENCY calls run at once.
         """
-        print(f"🤖 Calling {agent_name} sub-agent...")
-
-        # In actual implementation, this would be:
-        # result = claude_code.call_agent(agent_name, {
-        #     "prompt": prompt,
-        #     "context": context or {}
-        # })
-
-        # Mock responses for testing
-        if agent_name == "task-extractor":
-            return self._mock_task_extractor_response(prompt)
-        elif agent_name == "priority-strategist":
-            return self._mock_priority_strategist_response(prompt, context)
-        elif agent_name == "task-architect":
-            return self._mock_task_architect_response(prompt, context)
-        elif agent_name == "day-optimizer":
-            return self._mock_day_optimizer_response(prompt, context)
-        else:
-            raise SubAgentError(f"Unknown sub-agent: {agent_name}")
+        if self._agent_semaphore is None:
+            self._agent_semaphore = asyncio.Semaphore(AGENT_CONCURRENCY)
+
+        async with self._agent_semaphore:
+            logger.info(f"🤖 Calling {agent_name} sub-agent...")
+
+            # In actual implementation, this would be:
+            # result = await claude_code.call_agent(agent_name, {
+            #     "prompt": prompt,
+            #     "context": context or {}
+            # })
+
+            # Mock responses for testing
+            handler = getattr(self, self._AGENT_DISPATCH.get(agent_name) or "", None)
+            if handler is None:
+                raise SubAgentError(f"Unknown sub-agent: {agent_name}")
+            return await asyncio.to_thread(handler, prompt, context)
+
+    @staticmethod
+    def _build_tasks(structured_tasks: List[Dict[str, Any]]) -> List["Task"]:
+        """
+        Validate architect output into Task models
+
+        Agent output is still validated (construct() would leave enum fields as
+        plain strings), but as one list in pydantic-core. If that fails, the
+        invalid tasks are reported from the error locations and the rest kept.
+        """
+        from pydantic import ValidationError
 
-    def _mock_task_extractor_response(self, brain_dump: str) -> Dict[str, Any]:
+        adapter = _task_list_adapter()
+        try:
+            return adapter.validate_python(structured_tasks)
+        except ValidationError as e:
+            errors: Dict[int, List[str]] = {}
+            for error in e.errors():
+                index, *field = error["loc"]
+                errors.setdefault(index, []).append(f"{'.'.join(map(str, field)) or 'task'}: {error['msg']}")
+
+        for index, messages in errors.items():
+            task_data = structured_tasks[index]
+            title = task_data.get('title', 'unknown') if isinstance(task_data, dict) else 'unknown'
+            logger.warning(f"⚠️  Error creating task #{index} from {title}: {'; '.join(messages)}")
+        return adapter.validate_python(
+            [task_data for index, task_data in enumerate(structured_tasks) if index not in errors]
+        )
+
+    def _build_pipeline(self, scheduler: "Scheduler", brain_dump: str, target_date: str) -> None:
+        """
+        Add the processing stages to `scheduler`
+
+        The extractor node adds one prioritize -> architect chain per extracted
+        task once it knows how many there are; the optimizer waits on every
+        architect node and takes their tasks in priority_score order.
+        """
+        priority_context = {
+            "objectives": self._config_dict["objectives"],
+            "preferences": self.config.preferences
+        }
+        architect_context = {
+            "config": self._config_dict,
+            "date": target_date
+        }
+        optimizer_context = {
+            "preferences": self.config.preferences,
+            "work_hours": self.config.work_hours,
+            "energy_schedule": self.config.energy_schedule
+        }
+        score_settings = self.config.sub_agent_settings.get("priority_strategist", {})
+
+        def prioritize(raw_task):
+            async def run(_deps):
+                return await self._call_sub_agent("priority-strategist", [raw_task], priority_context)
+            return run
+
+        def architect(i):
+            async def run(deps):
+                prioritized = deps[f"prioritize:{i}"]["data"]
+                if not prioritized:
+                    return {"agent_name": "task-architect", "output_count": 0, "data": []}
+                scored = _score_priorities(prioritized, score_settings)
+                result = await self._call_sub_agent("task-architect", TaskBatch.from_records(scored),
+                                                    architect_context)
+                # Carried on the result so the optimizer and final task list can order by it
+                return {**result, "priority_score": scored[0]["priority_score"]}
+            return run
+
+        async def optimize(deps):
+            structured = [task for result in _by_priority_score(list(deps.values())) for task in result["data"]]
+            return await self._call_sub_agent("day-optimizer", TaskBatch.from_records(structured), optimizer_context)
+
+        async def extract(_deps):
+            result = await self._call_sub_agent("task-extractor", brain_dump)
+            raw_tasks = result["data"]
+            for i, raw_task in enumerate(raw_tasks):
+                scheduler.add_node(f"prioritize:{i}", ["extract"], prioritize(raw_task))
+                scheduler.add_node(f"architect:{i}", [f"prioritize:{i}"], architect(i))
+            scheduler.add_node("optimize", [f"architect:{i}" for i in range(len(raw_tasks))], optimize)
+            return result
+
+        scheduler.add_node("extract", [], extract)
+
+    @staticmethod
+    def _merge_agent_results(agent_name: str, results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Fold per-item agent responses into one response shaped like a single batch call"""
+        data = [item for result in results for item in result["data"]]
+        return {
+            "agent_name": agent_name,
+            "input_summary": f"Merged {len(results)} per-task {agent_name} calls",
+            "output_count": len(data),
+            "data": data
+        }
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _canned_extracted_tasks() -> Tuple[Dict[str, Any], ...]:
+        """Canned task-extractor entries, built once and shared: treat as read-only"""
+        return (
+            {
+                "title": "Finish setting up task management system",
+                "description": "Complete the implementation and testing",
+                "raw_priority": "high",
+                "estimated_minutes": 120,
+                "category_hint": "development",
+                "subtasks": ["Set up database", "Create frontend", "Test workflow"],
+                "notes": ["Critical for productivity"],
+                "extracted_from": "need to finish the task system"
+            },
+            {
+                "title": "Write project documentation",
+                "description": "Document setup and usage instructions",
+                "raw_priority": "medium",
+                "estimated_minutes": 60,
+                "category_hint": "admin",
+                "subtasks": [],
+                "notes": [],
+                "extracted_from": "write some docs"
+            },
+            {
+                "title": "Review and optimize workflow",
+                "description": "Analyze current process and improve",
+                "raw_priority": "low",
+                "estimated_minutes": 45,
+                "category_hint": "planning",
+                "subtasks": [],
+                "notes": ["Nice to have"],
+                "extracted_from": "maybe optimize the workflow"
+            }
+        )
+
+    def _mock_task_extractor_response(self, brain_dump: str, context: Dict = None) -> Dict[str, Any]:
         """Mock response from task-extractor agent"""
         # In reality, this would parse the brain dump using Claude
-        # For now, create some sample tasks
+        # For now, return some sample tasks
+        data = list(self._canned_extracted_tasks())
         return {
             "agent_name": "task-extractor",
             "input_summary": f"Processed brain dump of {len(brain_dump)} characters",
-            "output_count": 3,
-            "data": [
-                {
-                    "title": "Finish setting up task management system",
-                    "description": "Complete the implementation and testing",
-                    "raw_priority": "high",
-                    "estimated_minutes": 120,
-                    "category_hint": "development",
-                    "subtasks": ["Set up database", "Create frontend", "Test workflow"],
-                    "notes": ["Critical for productivity"],
-                    "extracted_from": "need to finish the task system"
-                },
-                {
-                    "title": "Write project documentation",
-                    "description": "Document setup and usage instructions",
-                    "raw_priority": "medium",
-                    "estimated_minutes": 60,
-                    "category_hint": "admin",
-                    "subtasks": [],
-                    "notes": [],
-                    "extracted_from": "write some docs"
-                },
-                {
-                    "title": "Review and optimize workflow",
-                    "description": "Analyze current process and improve",
-                    "raw_priority": "low",
-                    "estimated_minutes": 45,
-                    "category_hint": "planning",
-                    "subtasks": [],
-                    "notes": ["Nice to have"],
-                    "extracted_from": "maybe optimize the workflow"
-                }
-            ]
+            "output_count": len(data),
+            "data": data
         }
 
-    def _mock_priority_strategist_response(self, prompt: str, context: Dict) -> Dict[str, Any]:
+    @staticmethod
+    def _requested(prompt: Prompt, canned: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Canned mock entries for the tasks listed in a prompt"""
+        if isinstance(prompt, TaskBatch):
+            titles = set(prompt.titles)
+        else:
+            items = from_json(prompt) if isinstance(prompt, (str, bytes)) else prompt
+            titles = {task.get("title") for task in items}
+        return [entry for entry in canned if entry["title"] in titles]
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _canned_priorities() -> Tuple[Dict[str, Any], ...]:
+        """Canned priority-strategist entries, built once and shared: treat as read-only"""
+        return (
+            {
+                "id": "task-1",
+                "title": "Finish setting up task management system",
+                "priority": "P1",
+                "action": "keep",
+                "alignment_score": 95,
+                "urgency_score": 80,
+                "impact_score": 90,
+                "strategic_value": "Critical for achieving productivity objective",
+                "justification": "High alignment with productivity goals and urgent",
+                "objective_links": ["obj-1", "obj-2"],
+                "recommendations": ["Focus on core functionality first"]
+            },
+            {
+                "id": "task-2",
+                "title": "Write project documentation",
+                "priority": "P2",
+                "action": "keep",
+                "alignment_score": 60,
+                "urgency_score": 30,
+                "impact_score": 50,
+                "strategic_value": "Supports system adoption and learning",
+                "justification": "Moderate alignment, not urgent but valuable",
+                "objective_links": ["obj-1"],
+                "recommendations": ["Keep concise, focus on setup instructions"]
+            },
+            {
+                "id": "task-3",
+                "title": "Review and optimize workflow",
+                "priority": "P3",
+                "action": "defer",
+                "alignment_score": 40,
+                "urgency_score": 10,
+                "impact_score": 30,
+                "strategic_value": "Future optimization opportunity",
+                "justification": "Low urgency, can be deferred for later",
+                "objective_links": [],
+                "recommendations": ["Schedule for next week"]
+            }
+        )
+
+    def _mock_priority_strategist_response(self, prompt: Prompt, context: Dict) -> Dict[str, Any]:
         """Mock response from priority-strategist agent"""
+        data = self._requested(prompt, self._canned_priorities())
         return {
             "agent_name": "priority-strategist",
-            "input_summary": "Evaluated 3 tasks against user objectives",
-            "output_count": 3,
-            "data": [
-                {
-                    "id": "task-1",
-                    "title": "Finish setting up task management system",
-                    "priority": "P1",
-                    "action": "keep",
-                    "alignment_score": 95,
-                    "urgency_score": 80,
-                    "impact_score": 90,
-                    "strategic_value": "Critical for achieving productivity objective",
-                    "justification": "High alignment with productivity goals and urgent",
-                    "objective_links": ["obj-1", "obj-2"],
-                    "recommendations": ["Focus on core functionality first"]
+            "input_summary": f"Evaluated {len(data)} tasks against user objectives",
+            "output_count": len(data),
+            "data": data
+        }
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _canned_architected_tasks() -> Tuple[Dict[str, Any], ...]:
+        """Canned task-architect entries, built once and shared: treat as read-only"""
+        return (
+            {
+                "id": "task-1",
+                "title": "Finish setting up task management system",
+                "description": "Complete implementation including database, frontend, and testing",
+                "priority": "P1",
+                "category": "development",
+                "estimated_minutes": 120,
+                "time_block": "morning",
+                "success_criteria": "System deployed and processing brain dumps successfully",
+                "subtasks": [
+                    {
+                        "title": "Complete backend implementation",
+                        "estimated_minutes": 45,
+                        "success_criteria": "All Python modules working and tested"
+                    },
+                    {
+                        "title": "Build and deploy frontend",
+                        "estimated_minutes": 60,
+                        "success_criteria": "UI displaying tasks and syncing with database"
+                    },
+                    {
+                        "title": "Test end-to-end workflow",
+                        "estimated_minutes": 15,
+                        "success_criteria": "Complete workflow from brain dump to UI working"
+                    }
+                ],
+                "context": {
+                    "tools_needed": ["VS Code", "Python", "Node.js"],
+                    "files_to_reference": ["README.md", "schema.sql"],
+                    "dependencies": [],
+                    "potential_blockers": ["Supabase setup required"]
                 },
-                {
-                    "id": "task-2",
-                    "title": "Write project documentation",
-                    "priority": "P2",
-                    "action": "keep",
-                    "alignment_score": 60,
-                    "urgency_score": 30,
-                    "impact_score": 50,
-                    "strategic_value": "Supports system adoption and learning",
-                    "justification": "Moderate alignment, not urgent but valuable",
-                    "objective_links": ["obj-1"],
-                    "recommendations": ["Keep concise, focus on setup instructions"]
+                "execution_notes": ["Start with backend completion", "Test each component", "Deploy incrementally"]
+            },
+            {
+                "id": "task-2",
+                "title": "Write project documentation",
+                "description": "Create setup guide and usage instructions",
+                "priority": "P2",
+                "category": "admin",
+                "estimated_minutes": 60,
+                "time_block": "afternoon",
+                "success_criteria": "Documentation allows new user to set up system independently",
+                "subtasks": [],
+                "context": {
+                    "tools_needed": ["Text editor"],
+                    "files_to_reference": ["All implementation files"],
+                    "dependencies": ["System must be working first"],
+                    "potential_blockers": []
                 },
-                {
-                    "id": "task-3",
-                    "title": "Review and optimize workflow",
-                    "priority": "P3",
-                    "action": "defer",
-                    "alignment_score": 40,
-                    "urgency_score": 10,
-                    "impact_score": 30,
-                    "strategic_value": "Future optimization opportunity",
-                    "justification": "Low urgency, can be deferred for later",
-                    "objective_links": [],
-                    "recommendations": ["Schedule for next week"]
-                }
-            ]
-        }
+                "execution_notes": ["Focus on setup steps", "Include troubleshooting", "Add screenshots if helpful"]
+            }
+        )
 
-    def _mock_task_architect_response(self, prompt: str, context: Dict) -> Dict[str, Any]:
+    def _mock_task_architect_response(self, prompt: Prompt, context: Dict) -> Dict[str, Any]:
         """Mock response from task-architect agent"""
+        data = self._requested(prompt, self._canned_architected_tasks())
         return {
             "agent_name": "task-architect",
-            "input_summary": "Structured 2 prioritized tasks with metadata",
-            "output_count": 2,
-            "data": [
+            "input_summary": f"Structured {len(data)} prioritized tasks with metadata",
+            "output_count": len(data),
+            "data": data
+        }
+
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def _canned_schedule(target_date: str) -> Dict[str, Any]:
+        """Canned day-optimizer schedule, built once per date and shared: treat as read-only"""
+        return {
+            "date": target_date,
+            "total_estimated_minutes": 180,
+            "total_tasks": 2,
+            "optimization_notes": "Scheduled complex development work in morning peak energy period",
+            "schedule": [
                 {
-                    "id": "task-1",
-                    "title": "Finish setting up task management system",
-                    "description": "Complete implementation including database, frontend, and testing",
-                    "priority": "P1",
-                    "category": "development",
-                    "estimated_minutes": 120,
-                    "time_block": "morning",
-                    "success_criteria": "System deployed and processing brain dumps successfully",
-                    "subtasks": [
-                        {
-                            "title": "Complete backend implementation",
-                            "estimated_minutes": 45,
-                            "success_criteria": "All Python modules working and tested"
-                        },
+                    "time_slot": "09:00-11:00",
+                    "block_type": "deep_work",
+                    "tasks": [
                         {
-                            "title": "Build and deploy frontend",
-                            "estimated_minutes": 60,
-                            "success_criteria": "UI displaying tasks and syncing with database"
-                        },
-                        {
-                            "title": "Test end-to-end workflow",
-                            "estimated_minutes": 15,
-                            "success_criteria": "Complete workflow from brain dump to UI working"
+                            "id": "task-1",
+                            "title": "Finish setting up task management system",
+                            "estimated_minutes": 120,
+                            "priority": "P1"
                         }
                     ],
-                    "context": {
-                        "tools_needed": ["VS Code", "Python", "Node.js"],
-                        "files_to_reference": ["README.md", "schema.sql"],
-                        "dependencies": [],
-                        "potential_blockers": ["Supabase setup required"]
-                    },
-                    "execution_notes": ["Start with backend completion", "Test each component", "Deploy incrementally"]
+                    "context_note": "Peak energy period - complex development work",
+                    "total_minutes": 120
                 },
                 {
-                    "id": "task-2",
-                    "title": "Write project documentation",
-                    "description": "Create setup guide and usage instructions",
-                    "priority": "P2",
-                    "category": "admin",
-                    "estimated_minutes": 60,
-                    "time_block": "afternoon",
-                    "success_criteria": "Documentation allows new user to set up system independently",
-                    "subtasks": [],
-                    "context": {
-                        "tools_needed": ["Text editor"],
-                        "files_to_reference": ["All implementation files"],
-                        "dependencies": ["System must be working first"],
-                        "potential_blockers": []
-                    },
-                    "execution_notes": ["Focus on setup steps", "Include troubleshooting", "Add screenshots if helpful"]
+                    "time_slot": "11:00-11:15",
+                    "block_type": "break",
+                    "tasks": [],
+                    "context_note": "Energy restoration break",
+                    "total_minutes": 15
+                },
+                {
+                    "time_slot": "14:00-15:00",
+                    "block_type": "admin_work",
+                    "tasks": [
+                        {
+                            "id": "task-2",
+                            "title": "Write project documentation",
+                            "estimated_minutes": 60,
+                            "priority": "P2"
+                        }
+                    ],
+                    "context_note": "Afternoon energy - admin and documentation",
+                    "total_minutes": 60
                 }
-            ]
+            ],
+            "warnings": [],
+            "suggestions": ["Take breaks between intensive work sessions"]
         }
 
-    def _mock_day_optimizer_response(self, prompt: str, context: Dict) -> Dict[str, Any]:
+    def _mock_day_optimizer_response(self, prompt: Prompt, context: Dict) -> Dict[str, Any]:
         """Mock response from day-optimizer agent"""
         return {
             "agent_name": "day-optimizer",
             "input_summary": "Optimized schedule for 2 tasks across morning and afternoon",
             "output_count": 1,
-            "data": {
-                "date": date.today().isoformat(),
-                "total_estimated_minutes": 180,
-                "total_tasks": 2,
-                "optimization_notes": "Scheduled complex development work in morning peak energy period",
-                "schedule": [
-                    {
-                        "time_slot": "09:00-11:00",
-                        "block_type": "deep_work",
-                        "tasks": [
-                            {
-                                "id": "task-1",
-                                "title": "Finish setting up task management system",
-                                "estimated_minutes": 120,
-                                "priority": "P1"
-                            }
-                        ],
-                        "context_note": "Peak energy period - complex development work",
-                        "total_minutes": 120
-                    },
-                    {
-                        "time_slot": "11:00-11:15",
-                        "block_type": "break",
-                        "tasks": [],
-                        "context_note": "Energy restoration break",
-                        "total_minutes": 15
-                    },
-                    {
-                        "time_slot": "14:00-15:00",
-                        "block_type": "admin_work",
-                        "tasks": [
-                            {
-                                "id": "task-2",
-                                "title": "Write project documentation",
-                                "estimated_minutes": 60,
-                                "priority": "P2"
-                            }
-                        ],
-                        "context_note": "Afternoon energy - admin and documentation",
-                        "total_minutes": 60
-                    }
-                ],
-                "warnings": [],
-                "suggestions": ["Take breaks between intensive work sessions"]
-            }
+            "data": self._canned_schedule(date.today().isoformat())
         }
 
-    def process_brain_dump(self, input_file: str = "brain_dump.txt", target_date: str = None) -> SyncResult:
+    def join(self) -> Optional["SyncResult"]:
+        """
+        Wait for the background Supabase push started by process_brain_dump
+
+        Returns its SyncResult, or None if no push is pending. A failed push is
+        reported but doesn't fail the run: the tasks are saved locally either way.
+        """
+        if self._pending_sync is None:
+            return None
+
+        from backend.sync import SyncResult
+
+        future, self._pending_sync = self._pending_sync, None
+        try:
+            sync_result = future.result()
+        except Exception as e:
+            sync_result = SyncResult(success=False, message=f"Error syncing tasks: {e}", error=str(e))
+
+        if sync_result.success:
+            logger.info(f"✅ {sync_result.message}")
+        else:
+            logger.warning(f"⚠️  Sync warning: {sync_result.message}")
+        return sync_result
+
+    def process_brain_dump(self, input_file: str = "brain_dump.txt", target_date: str = None) -> "SyncResult":
         """
         Main processing workflow
 
@@ -333,74 +723,71 @@ class MorningProcessor:
         Returns:
             SyncResult indicating success/failure
         """
+        async def run():
+            try:
+                return await self.process_brain_dump_async(input_file, target_date)
+            finally:
+                # The async Supabase client is bound to this loop
+                await self.sync.aclose()
+
+        return asyncio.run(run())
+
+    async def process_brain_dump_async(self, input_file: str = "brain_dump.txt", target_date: str = None) -> "SyncResult":
+        """
+        Main processing workflow (coroutine)
+
+        Stages still run in order, but the per-task stages (prioritize,
+        structure) call their agent once per task, concurrently.
+        """
+        from backend.sync import SyncResult
+
+        self._agent_semaphore = asyncio.Semaphore(AGENT_CONCURRENCY)
+
         if not target_date:
             target_date = date.today().isoformat()
 
         try:
-            print(f"🧠 Processing brain dump for {target_date}")
+            logger.info(f"🧠 Processing brain dump for {target_date}")
 
             # Step 1: Read brain dump
-            print("📖 Reading brain dump...")
+            logger.info("📖 Reading brain dump...")
             brain_dump = self._read_brain_dump(input_file)
-            print(f"✅ Read {len(brain_dump)} characters")
-
-            # Step 2: Extract tasks
-            print("🔍 Extracting tasks...")
-            extraction_result = self._call_sub_agent("task-extractor", brain_dump)
-            raw_tasks = extraction_result["data"]
-            print(f"✅ Extracted {len(raw_tasks)} tasks")
-
-            # Step 3: Prioritize tasks
-            print("🎯 Prioritizing tasks...")
-            priority_context = {
-                "objectives": [obj.dict() for obj in self.config.objectives],
-                "preferences": self.config.preferences
-            }
-            priority_result = self._call_sub_agent("priority-strategist",
-                                                 json.dumps(raw_tasks),
-                                                 priority_context)
-            prioritized_tasks = priority_result["data"]
-            print(f"✅ Prioritized {len(prioritized_tasks)} tasks")
-
-            # Step 4: Structure tasks
-            print("🏗️  Structuring tasks...")
-            architect_context = {
-                "config": self.config.dict(),
-                "date": target_date
-            }
-            architect_result = self._call_sub_agent("task-architect",
-                                                  json.dumps(prioritized_tasks),
-                                                  architect_context)
+            logger.info(f"✅ Read {len(brain_dump)} characters")
+
+            # Steps 2-5: extract -> prioritize -> structure -> optimize, run as a DAG so
+            # each task moves to the architect as soon as its own prioritization is done
+            scheduler = Scheduler()
+            self._build_pipeline(scheduler, brain_dump, target_date)
+            results = await scheduler.run()
+
+            extraction_result = results["extract"]
+            task_count = len(extraction_result["data"])
+            priority_result = self._merge_agent_results(
+                "priority-strategist", [results[f"prioritize:{i}"] for i in range(task_count)]
+            )
+            priority_result["data"] = _score_priorities(
+                priority_result["data"], self.config.sub_agent_settings.get("priority_strategist", {})
+            )
+            architect_result = self._merge_agent_results(
+                "task-architect", _by_priority_score([results[f"architect:{i}"] for i in range(task_count)])
+            )
             structured_tasks = architect_result["data"]
-            print(f"✅ Structured {len(structured_tasks)} tasks")
-
-            # Step 5: Optimize schedule
-            print("⏰ Optimizing schedule...")
-            optimizer_context = {
-                "preferences": self.config.preferences,
-                "work_hours": self.config.work_hours,
-                "energy_schedule": self.config.energy_schedule
-            }
-            optimizer_result = self._call_sub_agent("day-optimizer",
-                                                  json.dumps(structured_tasks),
-                                                  optimizer_context)
+            optimizer_result = results["optimize"]
             schedule = optimizer_result["data"]
-            print(f"✅ Created optimized schedule")
+            logger.info(f"✅ Extracted {task_count}, prioritized {priority_result['output_count']}, "
+                        f"structured {len(structured_tasks)} tasks and created optimized schedule")
 
             # Step 6: Convert to Task objects
-            print("📋 Creating task objects...")
-            tasks = []
-            for task_data in structured_tasks:
-                try:
-                    task = Task(**task_data)
-                    tasks.append(task)
-                except Exception as e:
-                    print(f"⚠️  Error creating task from {task_data.get('title', 'unknown')}: {e}")
+            logger.info("📋 Creating task objects...")
+            tasks = self._build_tasks(structured_tasks)
+
+            logger.info(f"✅ Created {len(tasks)} task objects")
 
-            print(f"✅ Created {len(tasks)} task objects")
+            # Dumped once; the saved file and the returned result share this list
+            final_tasks = [task.model_dump() for task in tasks]
 
             # Step 7: Save processed data
-            print("💾 Saving processed data...")
+            logger.info("💾 Saving processed data...")
             processed_data = {
                 "date": target_date,
                 "brain_dump": brain_dump,
@@ -408,43 +795,50 @@ class MorningProcessor:
                 "priority_result": priority_result,
                 "architect_result": architect_result,
                 "optimizer_result": optimizer_result,
-                "final_tasks": [task.dict() for task in tasks],
+                "final_tasks": final_tasks,
                 "schedule": schedule,
                 "processed_at": datetime.now().isoformat()
             }
 
             processed_file = self.processed_dir / f"morning_processing_{target_date}.json"
-            with open(processed_file, 'w', encoding='utf-8') as f:
-                json.dump(processed_data, f, indent=2, default=str)
-
-            print(f"✅ Saved to {processed_file}")
+            # pydantic-core's encoder handles enums and datetimes natively; compact
+            # output since this is an archive of agent responses, not a hand-edited file
+            payload = to_json(processed_data, fallback=str)
+            # Written to a unique file beside the target and renamed over it, so a
+            # crash mid-write never leaves a truncated archive and two runs for the
+            # same date never share a temp file
+            fd, tmp_file = tempfile.mkstemp(dir=self.processed_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(payload)
+                os.replace(tmp_file, processed_file)
+            except BaseException:
+                Path(tmp_file).unlink(missing_ok=True)
+                raise
+
+            logger.info(f"✅ Saved to {processed_file}")
 
             # Step 8: Sync to Supabase
-            print("☁️  Syncing to Supabase...")
-            sync_result = self.sync.push_tasks(tasks, target_date)
-
-            if sync_result.success:
-                print(f"✅ {sync_result.message}")
-                return SyncResult(
-                    success=True,
-                    message=f"Successfully processed brain dump: {len(tasks)} tasks created for {target_date}",
-                    data={
-                        "tasks": [task.dict() for task in tasks],
-                        "schedule": schedule,
-                        "processed_file": str(processed_file)
-                    }
-                )
-            else:
-                print(f"⚠️  Sync warning: {sync_result.message}")
-                return SyncResult(
-                    success=True,
-                    message=f"Tasks processed but sync failed: {sync_result.error}",
-                    data={"tasks": [task.dict() for task in tasks]}
-                )
+            # The processed data is already on disk, so the push runs on a worker
+            # thread and the caller collects its outcome with join()
+            logger.info("☁️  Syncing to Supabase in the background...")
+            executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="supabase-push")
+            self._pending_sync = executor.submit(self.sync.push_tasks, tasks, target_date)
+            executor.shutdown(wait=False)
+
+            return SyncResult(
+                success=True,
+                message=f"Successfully processed brain dump: {len(tasks)} tasks created for {target_date} (sync queued)",
+                data={
+                    "tasks": final_tasks,
+                    "schedule": schedule,
+                    "processed_file": str(processed_file)
+                }
+            )
 
         except Exception as e:
             error_msg = f"Error processing brain dump: {e}"
-            print(f"❌ {error_msg}")
+            logger.error(f"❌ {error_msg}")
             return SyncResult(
                 success=False,
                 message=error_msg,
@@ -466,20 +860,23 @@ def main():
 
     args = parser.parse_args()
 
+    logging.basicConfig(level=logging.INFO, format="%(message)s", handlers=[_StdoutHandler(sys.stdout)])
+
     try:
         processor = MorningProcessor(config_file=args.config)
         result = processor.process_brain_dump(args.input, args.date)
 
         if result.success:
-            print(f"\n🎉 {result.message}")
+            logger.info(f"\n🎉 {result.message}")
             if result.data and 'tasks' in result.data:
-                print(f"📋 Created {len(result.data['tasks'])} tasks")
+                logger.info(f"📋 Created {len(result.data['tasks'])} tasks")
+            processor.join()
         else:
-            print(f"\n💥 {result.message}")
+            logger.error(f"\n💥 {result.message}")
             sys.exit(1)
 
     except Exception as e:
-        print(f"\n💥 Unexpected error: {e}")
+        logger.error(f"\n💥 Unexpected error: {e}")
         sys.exit(1)
 
 
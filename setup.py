@@ -12,12 +12,16 @@ import subprocess
 import shutil
 from pathlib import Path
 
+# pip for the interpreter running this script, resolved once; unlike
+# shutil.which("pip") it can't pick up a pip belonging to another Python
+PIP = [sys.executable, "-m", "pip"]
+
 
 def run_command(command, description=""):
-    """Run a shell command and handle errors"""
-    print(f"🔄 {description or command}")
+    """Run a command (argv list, no shell) and handle errors"""
+    print(f"🔄 {description or ' '.join(command)}")
     try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
+        result = subprocess.run(command, check=True, capture_output=True, text=True)
         if result.stdout:
             print(f"✅ {result.stdout.strip()}")
         return True
@@ -31,8 +35,8 @@ def run_command(command, description=""):
 def check_python():
     """Check Python version"""
     version = sys.version_info
-    if version.major < 3 or (version.major == 3 and version.minor < 8):
-        print("❌ Python 3.8+ is required")
+    if version.major < 3 or (version.major == 3 and version.minor < 10):
+        print("❌ Python 3.10+ is required")
         return False
     print(f"✅ Python {version.major}.{version.minor}.{version.micro}")
     return True
@@ -42,15 +46,18 @@ def install_dependencies():
     """Install Python dependencies"""
     print("\n📦 Installing Python dependencies...")
 
-    # Try to install core dependencies first
+    # Try to install core dependencies first, in one pip run; only if that
+    # fails are they retried one by one so a single bad package doesn't block the rest
     core_deps = ["supabase", "python-dotenv", "pydantic"]
-    for dep in core_deps:
-        if not run_command(f"pip install {dep}", f"Installing {dep}"):
-            print(f"⚠️  Failed to install {dep}, continuing...")
+    if not run_command([*PIP, "install", *core_deps], "Installing core dependencies"):
+        for dep in core_deps:
+            if not run_command([*PIP, "install", dep], f"Installing {dep}"):
+                print(f"⚠️  Failed to install {dep}, continuing...")
 
     # Try to install from requirements.txt
     if Path("backend/requirements.txt").exists():
-        run_command("pip install -r backend/requirements.txt", "Installing all dependencies")
+        run_command([*PIP, "install", "-r", "backend/requirements.txt"],
+                    "Installing all dependencies")
 
 
 def setup_environment():
@@ -5,21 +5,19 @@ Test Supabase connection without expecting data
 
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-# Add backend to path
-sys.path.append(str(Path(__file__).parent / "backend"))
-
-def test_supabase_connection():
+def test_supabase_connection(log=print):
     """Test basic Supabase connection"""
-    print("Testing Supabase connection...")
+    log("Testing Supabase connection...")
 
     try:
-        from sync import TaskSync
+        from backend.sync import TaskSync
 
         # Test connection
         sync = TaskSync()
-        print("[OK] Supabase client created successfully")
+        log("[OK] Supabase client created successfully")
 
         # Test database access (should work even with empty database)
         from datetime import date
@@ -29,30 +27,30 @@ def test_supabase_connection():
 
         if result.success:
             task_count = len(result.data.get('tasks', [])) if result.data else 0
-            print(f"[OK] Database connection successful")
-            print(f"[INFO] Found {task_count} tasks for {today} (expected 0 for new database)")
+            log(f"[OK] Database connection successful")
+            log(f"[INFO] Found {task_count} tasks for {today} (expected 0 for new database)")
             return True
         else:
             # Check if it's just "no data found" vs connection error
             if "No tasks found" in result.message:
-                print("[OK] Database connection successful (no data found, which is expected)")
+                log("[OK] Database connection successful (no data found, which is expected)")
                 return True
             else:
-                print(f"[FAIL] Database error: {result.message}")
+                log(f"[FAIL] Database error: {result.message}")
                 return False
 
     except Exception as e:
-        print(f"[FAIL] Connection failed: {e}")
-        print("[INFO] Make sure your backend/.env file has correct Supabase credentials")
+        log(f"[FAIL] Connection failed: {e}")
+        log("[INFO] Make sure your backend/.env file has correct Supabase credentials")
         return False
 
-def test_frontend_env():
+def test_frontend_env(log=print):
     """Check if frontend environment file exists"""
-    print("Checking frontend environment setup...")
+    log("Checking frontend environment setup...")
 
     env_file = Path("frontend/.env.local")
     if env_file.exists():
-        print("[OK] frontend/.env.local exists")
+        log("[OK] frontend/.env.local exists")
 
         # Check if it has the required variables (without showing secrets)
         with open(env_file, 'r') as f:
@@ -62,14 +60,14 @@ def test_frontend_env():
         has_key = 'NEXT_PUBLIC_SUPABASE_ANON_KEY' in content
 
         if has_url and has_key:
-            print("[OK] Required environment variables are present")
+            log("[OK] Required environment variables are present")
             return True
         else:
-            print("[FAIL] Missing required environment variables")
-            print("Need: NEXT_PUBLIC_SUPABASE_URL and NEXT_PUBLIC_SUPABASE_ANON_KEY")
+            log("[FAIL] Missing required environment variables")
+            log("Need: NEXT_PUBLIC_SUPABASE_URL and NEXT_PUBLIC_SUPABASE_ANON_KEY")
             return False
     else:
-        print("[FAIL] frontend/.env.local not found")
+        log("[FAIL] frontend/.env.local not found")
         return False
 
 def main():
@@ -82,10 +80,19 @@ def main():
         ("Supabase Connection", test_supabase_connection)
     ]
 
+    # The checks are independent (network vs local file), so run them together;
+    # each logs into its own buffer and output is printed in the original order
+    logs = {test_name: [] for test_name, _ in tests}
+    with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+        futures = {test_name: executor.submit(test_func, logs[test_name].append)
+                   for test_name, test_func in tests}
+
     results = {}
-    for test_name, test_func in tests:
+    for test_name, _ in tests:
         print(f"\n{test_name}:")
-        results[test_name] = test_func()
+        results[test_name] = futures[test_name].result()
+        for line in logs[test_name]:
+            print(line)
 
     # Summary
     print("\n" + "=" * 40)
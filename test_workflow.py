@@ -12,23 +12,115 @@ Usage:
     python test_workflow.py [--verbose] [--skip-supabase]
 """
 
+import io
 import json
+import logging
 import sys
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
 
-# Add backend to path
-sys.path.append(str(Path(__file__).parent / "backend"))
+# process_morning and generate_report are imported as top-level modules from scripts/
+_SCRIPTS = str(Path(__file__).parent / "scripts")
+if _SCRIPTS not in sys.path:
+    sys.path.insert(0, _SCRIPTS)
 
 try:
-    from models import Task, DailyTasks, Config
-    from sync import TaskSync, SyncResult
+    from backend.models import Task, DailyTasks, Config
+    from backend.sync import TaskSync, SyncResult
 except ImportError as e:
     print(f"❌ Error importing backend modules: {e}")
     print("Make sure you're running from the project root directory")
     sys.exit(1)
 
+# Imported once here rather than inside the tests, so their timing is test work only;
+# a broken script fails its own test instead of the whole run
+try:
+    from process_morning import MorningProcessor
+except ImportError as e:
+    MorningProcessor = None
+    _MORNING_IMPORT_ERROR = e
+
+try:
+    from generate_report import ReportGenerator
+except ImportError as e:
+    ReportGenerator = None
+    _REPORT_IMPORT_ERROR = e
+
+
+# Built once per process; re-runs reuse the loaded config and Supabase clients
+@lru_cache(maxsize=1)
+def _get_morning_processor():
+    return MorningProcessor()
+
+
+@lru_cache(maxsize=1)
+def _get_report_generator():
+    return ReportGenerator()
+
+# Checked by test_file_structure, reported in this order
+REQUIRED_FILES = (
+    "backend/models.py",
+    "backend/sync.py",
+    "backend/schema.sql",
+    "backend/config.json",
+    "scripts/process_morning.py",
+    "scripts/generate_report.py",
+    "frontend/package.json",
+    "frontend/app/page.tsx",
+    "agents/task-extractor.md",
+    "agents/priority-strategist.md",
+    "data/input/brain_dump.txt",
+)
+
+REQUIRED_DIRS = (
+    "backend",
+    "scripts",
+    "frontend",
+    "agents",
+    "data/input",
+    "data/processed",
+    "data/daily",
+    "data/reports",
+)
+
+
+class _ThreadOutput(io.TextIOBase):
+    """
+    sys.stdout stand-in that gives each test thread its own buffer
+
+    Writes from a thread with no buffer (the main thread, helper threads a
+    test starts) go straight to the real stream.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+
+    def write(self, text):
+        buffer = getattr(self.local, "buffer", None)
+        return (buffer or self.stream).write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+
+def _run_captured(output, tests):
+    """Run `tests` ({name: fn}) in order on this thread; returns {name: (result, printed output)}"""
+    outcomes = {}
+    for name, test in tests.items():
+        output.local.buffer = io.StringIO()
+        try:
+            result = test()
+        finally:
+            printed = output.local.buffer.getvalue()
+            output.local.buffer = None
+        outcomes[name] = (result, printed)
+    return outcomes
+
 
 def test_data_models():
     """Test data model creation and validation"""
@@ -54,6 +146,14 @@ def test_data_models():
         daily_tasks.update_summary()
         print("[OK] DailyTasks model and summary generation work")
 
+        # summary is stored under another attribute name; every dump option must still see it
+        assert daily_tasks.model_dump(by_alias=True)["summary"]["total_tasks"] == 1
+        assert '"summary"' in daily_tasks.model_dump_json(by_alias=True)
+        assert list(daily_tasks.model_dump(include={"tasks"})) == ["tasks"]
+        assert "summary" not in daily_tasks.model_dump(exclude={"summary"})
+        assert daily_tasks.model_dump(include={"summary": {"total_tasks"}}) == {"summary": {"total_tasks": 1}}
+        print("[OK] DailyTasks dumps honor by_alias, include and exclude")
+
         # Test task updates
         task.add_note("Test note added")
         task.add_subtask("Test subtask")
@@ -66,17 +166,17 @@ def test_data_models():
         return False
 
 
-def test_brain_dump_processing():
-    """Test the morning brain dump processing"""
+def test_brain_dump_processing(today=None, skip_supabase=False):
+    """Test the morning brain dump processing for `today` (YYYY-MM-DD, default: today)"""
     print("\n🧠 Testing brain dump processing...")
 
-    try:
-        # Import the morning processor
-        sys.path.append(str(Path(__file__).parent / "scripts"))
-        from process_morning import MorningProcessor
+    if MorningProcessor is None:
+        print(f"❌ Could not import process_morning: {_MORNING_IMPORT_ERROR}")
+        return False
 
+    try:
         # Create processor instance
-        processor = MorningProcessor()
+        processor = _get_morning_processor()
         print("✅ MorningProcessor initialized")
 
         # Test with the sample brain dump
@@ -86,10 +186,17 @@ def test_brain_dump_processing():
             return False
 
         # Process brain dump (this uses mock agents for testing)
-        result = processor.process_brain_dump("brain_dump.txt")
+        result = processor.process_brain_dump("brain_dump.txt", today)
+        # Wait for the background Supabase push so it can't outlive the test
+        sync_result = processor.join()
 
         if result.success:
             print(f"✅ Brain dump processed successfully: {result.message}")
+            if sync_result is not None and not sync_result.success:
+                if not skip_supabase:
+                    print(f"❌ Supabase push failed: {sync_result.message}")
+                    return False
+                print("⏭️  Ignoring Supabase push failure (--skip-supabase flag)")
             if result.data and 'tasks' in result.data:
                 print(f"📋 Created {len(result.data['tasks'])} tasks")
                 return True
@@ -102,8 +209,34 @@ def test_brain_dump_processing():
         return False
 
 
-def test_supabase_sync(skip_supabase=False):
-    """Test Supabase synchronization"""
+def test_retry_policy():
+    """Test which Supabase errors are retried as transient"""
+    print("\n🔁 Testing retry policy...")
+
+    try:
+        from postgrest.exceptions import APIError
+        from backend._retry import is_transient
+
+        # postgrest's `code` is a SQLSTATE or PGRST code unless the body wasn't JSON
+        for code in ("23505", "42501", "PGRST202"):
+            if is_transient(APIError({"code": code, "message": "test"})):
+                print(f"❌ Permanent error {code} treated as transient")
+                return False
+        for code in ("503", "429"):
+            if not is_transient(APIError({"code": code, "message": "test"})):
+                print(f"❌ HTTP {code} not treated as transient")
+                return False
+
+        print("✅ Only network errors, 429 and 5xx are retried")
+        return True
+
+    except Exception as e:
+        print(f"❌ Retry policy test failed: {e}")
+        return False
+
+
+def test_supabase_sync(skip_supabase=False, today=None):
+    """Test Supabase synchronization for `today` (YYYY-MM-DD, default: today)"""
     print("\n☁️  Testing Supabase sync...")
 
     if skip_supabase:
@@ -132,28 +265,21 @@ def test_supabase_sync(skip_supabase=False):
             )
         ]
 
-        test_date = date.today().isoformat()
+        test_date = today or date.today().isoformat()
 
-        # Test push
-        push_result = sync.push_tasks(test_tasks, test_date)
+        # Push, and verify persistence from the row the upsert returns
+        push_result = sync.push_and_verify(test_tasks, test_date)
         if push_result.success:
             print(f"✅ Push successful: {push_result.message}")
         else:
             print(f"❌ Push failed: {push_result.message}")
             return False
 
-        # Test pull
-        pull_result = sync.pull_tasks(test_date, use_cache=False)
-        if pull_result.success:
-            print(f"✅ Pull successful: {pull_result.message}")
-            pulled_tasks = pull_result.data.get('tasks', [])
-            if len(pulled_tasks) >= len(test_tasks):
-                print(f"✅ Data persistence verified: {len(pulled_tasks)} tasks retrieved")
-            else:
-                print(f"⚠️  Task count mismatch: expected {len(test_tasks)}, got {len(pulled_tasks)}")
+        stored_count = push_result.data['count']
+        if stored_count >= len(test_tasks):
+            print(f"✅ Data persistence verified: {stored_count} tasks stored")
         else:
-            print(f"❌ Pull failed: {pull_result.message}")
-            return False
+            print(f"⚠️  Task count mismatch: expected {len(test_tasks)}, got {stored_count}")
 
         return True
 
@@ -163,36 +289,36 @@ def test_supabase_sync(skip_supabase=False):
         return False
 
 
-def test_report_generation():
-    """Test report generation"""
+def test_report_generation(today=None):
+    """Test report generation for `today` (YYYY-MM-DD, default: today)"""
     print("\n📊 Testing report generation...")
 
-    try:
-        sys.path.append(str(Path(__file__).parent / "scripts"))
-        from generate_report import ReportGenerator
+    if ReportGenerator is None:
+        print(f"❌ Could not import generate_report: {_REPORT_IMPORT_ERROR}")
+        return False
 
-        generator = ReportGenerator()
+    try:
+        generator = _get_report_generator()
         print("✅ ReportGenerator initialized")
 
         # Generate daily report
-        today = date.today().isoformat()
+        today = today or date.today().isoformat()
         report_file = generator.generate_daily_report(today)
 
-        if Path(report_file).exists():
-            print(f"✅ Daily report generated: {report_file}")
+        # One stat tells us both that the report exists and how big it is
+        try:
+            size = os.stat(report_file).st_size
+        except FileNotFoundError:
+            print(f"❌ Report file not created: {report_file}")
+            return False
 
-            # Check report content
-            with open(report_file, 'r') as f:
-                content = f.read()
+        print(f"✅ Daily report generated: {report_file}")
 
-            if len(content) > 100:  # Basic content check
-                print("✅ Report contains substantive content")
-                return True
-            else:
-                print("⚠️  Report seems too short")
-                return False
+        if size > 100:  # Basic content check
+            print("✅ Report contains substantive content")
+            return True
         else:
-            print(f"❌ Report file not created: {report_file}")
+            print("⚠️  Report seems too short")
             return False
 
     except Exception as e:
@@ -200,59 +326,65 @@ def test_report_generation():
         return False
 
 
+def _list_dir(parent):
+    """Paths of the entries in `parent` ("" for the project root), or [] if it can't be listed"""
+    try:
+        with os.scandir(parent or ".") as entries:
+            return [f"{parent}/{entry.name}" if parent else entry.name for entry in entries]
+    except OSError:
+        return []
+
+
+def _existing_paths(paths):
+    """
+    Return which of `paths` exist, listing each parent directory once instead of a stat per path
+
+    Parents are listed a level at a time, on threads so their latency overlaps.
+    A parent that the level above shows is missing isn't listed, and neither
+    is anything below it.
+    """
+    levels = {}
+    for parent in {os.path.dirname(path) for path in paths}:
+        levels.setdefault(parent.count("/") + 1 if parent else 0, []).append(parent)
+
+    existing = set()
+    resolved = set()  # parents that were listed or are known to be missing
+    with ThreadPoolExecutor(max_workers=max(map(len, levels.values()), default=1)) as executor:
+        for depth in sorted(levels):
+            to_list = []
+            for parent in levels[depth]:
+                if parent and os.path.dirname(parent) in resolved and parent not in existing:
+                    resolved.add(parent)
+                else:
+                    to_list.append(parent)
+            existing.update(path for listing in executor.map(_list_dir, to_list) for path in listing)
+            resolved.update(to_list)
+    return existing
+
+
 def test_file_structure():
     """Test that all required files and directories exist"""
-    print("\n📁 Testing file structure...")
-
-    required_files = [
-        "backend/models.py",
-        "backend/sync.py",
-        "backend/schema.sql",
-        "backend/config.json",
-        "scripts/process_morning.py",
-        "scripts/generate_report.py",
-        "frontend/package.json",
-        "frontend/app/page.tsx",
-        "agents/task-extractor.md",
-        "agents/priority-strategist.md",
-        "data/input/brain_dump.txt"
-    ]
-
-    required_dirs = [
-        "backend",
-        "scripts",
-        "frontend",
-        "agents",
-        "data/input",
-        "data/processed",
-        "data/daily",
-        "data/reports"
-    ]
-
-    all_good = True
-
-    # Check directories
-    for directory in required_dirs:
-        if Path(directory).exists():
-            print(f"✅ Directory exists: {directory}")
-        else:
-            print(f"❌ Missing directory: {directory}")
-            all_good = False
+    log = ["\n📁 Testing file structure..."]
 
-    # Check files
-    for file_path in required_files:
-        if Path(file_path).exists():
-            print(f"✅ File exists: {file_path}")
-        else:
-            print(f"❌ Missing file: {file_path}")
-            all_good = False
+    existing = _existing_paths(REQUIRED_DIRS + REQUIRED_FILES)
+    missing_dirs = [directory for directory in REQUIRED_DIRS if directory not in existing]
+    missing_files = [file_path for file_path in REQUIRED_FILES if file_path not in existing]
+    all_good = not (missing_dirs or missing_files)
 
+    # Report what's missing first; present paths only as a count
+    log.extend(f"❌ Missing directory: {directory}" for directory in missing_dirs)
+    log.extend(f"❌ Missing file: {file_path}" for file_path in missing_files)
+    log.append(f"✅ {len(REQUIRED_DIRS) - len(missing_dirs)}/{len(REQUIRED_DIRS)} directories and "
+               f"{len(REQUIRED_FILES) - len(missing_files)}/{len(REQUIRED_FILES)} files present")
+
+    # One write for the whole test instead of one per line
+    sys.stdout.write("\n".join(log) + "\n")
     return all_good
 
 
 def test_frontend_setup():
     """Test frontend configuration"""
-    print("\n🌐 Testing frontend setup...")
+    log = ["\n🌐 Testing frontend setup..."]
 
     try:
         frontend_dir = Path("frontend")
@@ -260,21 +392,18 @@ def test_frontend_setup():
         # Check package.json
         package_json = frontend_dir / "package.json"
         if package_json.exists():
-            with open(package_json) as f:
-                pkg = json.load(f)
+            pkg = json.loads(package_json.read_bytes())
+            # `or ()` also covers a section that is present but null
+            all_deps = set(pkg.get("dependencies") or ()) | set(pkg.get("devDependencies") or ())
 
             required_deps = ["next", "react", "@supabase/supabase-js", "tailwindcss"]
-            missing_deps = []
-
-            for dep in required_deps:
-                if dep not in pkg.get("dependencies", {}) and dep not in pkg.get("devDependencies", {}):
-                    missing_deps.append(dep)
+            missing_deps = [dep for dep in required_deps if dep not in all_deps]
 
             if missing_deps:
-                print(f"⚠️  Missing frontend dependencies: {missing_deps}")
+                log.append(f"⚠️  Missing frontend dependencies: {missing_deps}")
                 return False
             else:
-                print("✅ Frontend dependencies look good")
+                log.append("✅ Frontend dependencies look good")
 
         # Check key files
         key_files = [
@@ -288,16 +417,19 @@ def test_frontend_setup():
         for file_path in key_files:
             full_path = frontend_dir / file_path
             if full_path.exists():
-                print(f"✅ Frontend file exists: {file_path}")
+                log.append(f"✅ Frontend file exists: {file_path}")
             else:
-                print(f"❌ Missing frontend file: {file_path}")
+                log.append(f"❌ Missing frontend file: {file_path}")
                 return False
 
         return True
 
     except Exception as e:
-        print(f"❌ Frontend setup test failed: {e}")
+        log.append(f"❌ Frontend setup test failed: {e}")
         return False
+    finally:
+        # One write for the whole test instead of one per line
+        sys.stdout.write("\n".join(log) + "\n")
 
 
 def generate_test_report(results):
@@ -306,18 +438,20 @@ def generate_test_report(results):
     print("🧪 TEST RESULTS SUMMARY")
     print("="*60)
 
+    # Count passes and build the detail lines in one pass over the results
     total_tests = len(results)
-    passed_tests = sum(1 for result in results.values() if result)
+    passed_tests = 0
+    detail_lines = ["\nDetailed Results:"]
+    for test_name, passed in results.items():
+        passed_tests += bool(passed)
+        detail_lines.append(f"  {'✅ PASS' if passed else '❌ FAIL'} {test_name}")
 
     print(f"Total tests: {total_tests}")
     print(f"Passed: {passed_tests}")
     print(f"Failed: {total_tests - passed_tests}")
     print(f"Success rate: {(passed_tests/total_tests)*100:.1f}%")
 
-    print("\nDetailed Results:")
-    for test_name, passed in results.items():
-        status = "✅ PASS" if passed else "❌ FAIL"
-        print(f"  {status} {test_name}")
+    print("\n".join(detail_lines))
 
     if passed_tests == total_tests:
         print("\n🎉 All tests passed! The system is ready to use.")
@@ -345,20 +479,58 @@ def main():
     print("Task Management System - End-to-End Testing")
     print("=" * 60)
 
-    # Run all tests
-    results = {
-        "File Structure": test_file_structure(),
-        "Data Models": test_data_models(),
-        "Brain Dump Processing": test_brain_dump_processing(),
-        "Supabase Sync": test_supabase_sync(args.skip_supabase),
-        "Report Generation": test_report_generation(),
-        "Frontend Setup": test_frontend_setup()
+    # One date for the whole run, so tests around midnight agree on "today"
+    today = date.today().isoformat()
+
+    tests = {
+        "File Structure": test_file_structure,
+        "Data Models": test_data_models,
+        "Retry Policy": test_retry_policy,
+        "Brain Dump Processing": lambda: test_brain_dump_processing(today, args.skip_supabase),
+        "Supabase Sync": lambda: test_supabase_sync(args.skip_supabase, today),
+        "Report Generation": lambda: test_report_generation(today),
+        "Frontend Setup": test_frontend_setup
     }
 
+    # Each of these reads what the one before it wrote, so they share a worker
+    # and keep their order; every other test gets a worker of its own
+    chained = ["Brain Dump Processing", "Supabase Sync", "Report Generation"]
+    jobs = [[name] for name in tests if name not in chained] + [chained]
+
+    # Run all tests, buffering each one's output so the log isn't interleaved
+    output = _ThreadOutput(sys.stdout)
+    sys.stdout = output
+    # process_morning reports progress through logging; show it with the test's output
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=output)
+    try:
+        with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+            futures = [executor.submit(_run_captured, output, {name: tests[name] for name in job})
+                       for job in jobs]
+            outcomes = {}
+            for future in as_completed(futures):
+                outcomes.update(future.result())
+    finally:
+        sys.stdout = output.stream
+
+    # Print in the original test order
+    results = {}
+    for test_name in tests:
+        passed, printed = outcomes[test_name]
+        sys.stdout.write(printed)
+        results[test_name] = passed
+
     # Generate summary
     all_passed = generate_test_report(results)
+    exit_code = 0 if all_passed else 1
+
+    if os.environ.get("CI"):
+        # Skip interpreter teardown in CI
+        logging.shutdown()
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(exit_code)
 
-    sys.exit(0 if all_passed else 1)
+    sys.exit(exit_code)
 
 
 if __name__ == "__main__":